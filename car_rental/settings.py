@@ -83,6 +83,9 @@ DATABASES = {
         "PORT": int(os.environ.get("POSTGRES_PORT", 5432)),
     }
 }
+# Reuse connections across requests; health checks drop ones the server closed.
+DATABASES["default"]["CONN_MAX_AGE"] = int(os.environ.get("POSTGRES_CONN_MAX_AGE", 60))
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
 
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
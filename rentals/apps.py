@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class RentalsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "rentals"
+
+    def ready(self):
+        from . import signals  # noqa: F401 - register receivers
@@ -19,3 +19,5 @@ CAR_LOSS_FEE_FIELDS = [
     ("loss_jack_fee", "Домкрат"),
     ("loss_fire_extinguisher_fee", "Огнетушитель"),
 ]
+
+CAR_LOSS_FEE_NAMES = tuple(field for field, _ in CAR_LOSS_FEE_FIELDS)
@@ -5,7 +5,7 @@ from django import forms
 from django.contrib.auth import get_user_model
 from django.contrib.auth.forms import PasswordChangeForm, SetPasswordForm, UserCreationForm
 
-from .car_constants import CAR_LOSS_FEE_FIELDS
+from .car_constants import CAR_LOSS_FEE_FIELDS, CAR_LOSS_FEE_NAMES
 from .models import (
     BusinessSettings,
     Car,
@@ -27,6 +27,9 @@ DATE_PLACEHOLDER = "ДД-ММ-ГГГГ"
 DRIVING_SINCE_INPUT_FORMATS = ("%Y", *DATE_INPUT_FORMATS)
 DRIVING_SINCE_PLACEHOLDER = "ГГГГ"
 DRIVING_SINCE_FULL_PLACEHOLDER = "ДД-ММ-ГГГГ"
+# Separators accepted between customer tags, in the form and in file imports.
+TAG_SPLIT_RE = re.compile(r"[;,#/|\n\r]+")
+_YEAR_ONLY_RE = re.compile(r"\d{4}")
 
 
 def _configure_date_field(field: forms.DateField):
@@ -40,7 +43,7 @@ def _configure_date_field(field: forms.DateField):
 def _is_year_only_input(value: str | None) -> bool:
     if not value:
         return False
-    return bool(re.fullmatch(r"\d{4}", value.strip()))
+    return bool(_YEAR_ONLY_RE.fullmatch(value.strip()))
 
 
 def _configure_driving_since_field(field: forms.DateField, *, year_only: bool = True):
@@ -97,7 +100,7 @@ class CarForm(StyledModelForm):
             "rate_1_4_low",
             "rate_5_14_low",
             "rate_15_plus_low",
-            *[field for field, _ in CAR_LOSS_FEE_FIELDS],
+            *CAR_LOSS_FEE_NAMES,
         ]
         for name in decimal_fields:
             if name in self.fields:
@@ -131,7 +134,7 @@ class CarForm(StyledModelForm):
             "rate_15_plus_low",
             "daily_rate",
             "is_active",
-            *[field for field, _ in CAR_LOSS_FEE_FIELDS],
+            *CAR_LOSS_FEE_NAMES,
         ]
         labels = {
             "daily_rate": "Базовый тариф (если нет градации)",
@@ -273,7 +276,7 @@ class CustomerForm(StyledModelForm):
 
     def _parse_tags(self, raw: str) -> list[CustomerTag]:
         names = set()
-        for piece in re.split(r"[;,#/|\n\r]+", raw or ""):
+        for piece in TAG_SPLIT_RE.split(raw or ""):
             normalized = piece.strip()
             if not normalized:
                 continue
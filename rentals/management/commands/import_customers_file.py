@@ -29,7 +29,8 @@ class Command(BaseCommand):
         with path.open("rb") as upload:
             # `_load_rows` uses upload.name to infer format.
             try:
-                rows = views._load_rows(upload)  # noqa: SLF001 - reuse proven import logic
+                # Rows are read lazily, so consume them before the file is closed.
+                rows = list(views._load_rows(upload))  # noqa: SLF001 - reuse proven import logic
             except Exception as exc:  # noqa: BLE001
                 raise CommandError(f"Failed to read file: {path}. Error: {exc}") from exc
 
@@ -38,24 +39,16 @@ class Command(BaseCommand):
             return
 
         created_count, updated_count, skipped_empty = 0, 0, 0
-        normalized_rows: list[dict] = []
+        # Normalize and deduplicate by license number in a single pass.
+        by_license: dict[str, dict] = {}
+        duplicate_rows = 0
+        tags_by_license: dict[str, list[str] | None] = {}
         for idx, row in enumerate(rows, start=1):
             if not any(views._clean_text_value(value) for value in row.values()):  # noqa: SLF001
                 skipped_empty += 1
                 continue
 
-            normalized = views._normalize_customer_row(row, idx)  # noqa: SLF001
-            normalized_rows.append(normalized)
-
-        if not normalized_rows:
-            self.stdout.write(self.style.WARNING("No valid rows found for import."))
-            return
-
-        # Deduplicate by license number inside the upload.
-        by_license: dict[str, dict] = {}
-        duplicate_rows = 0
-        tags_by_license: dict[str, list[str] | None] = {}
-        for item in normalized_rows:
+            item = views._normalize_customer_row(row, idx)  # noqa: SLF001
             key = item["license_number"]
             if key in by_license:
                 duplicate_rows += 1
@@ -63,36 +56,21 @@ class Command(BaseCommand):
             if item.get("tags") is not None:
                 tags_by_license[key] = item["tags"]
 
-        licenses = list(by_license.keys())
-        existing = {c.license_number: c for c in Customer.objects.filter(license_number__in=licenses)}
+        if not by_license:
+            self.stdout.write(self.style.WARNING("No valid rows found for import."))
+            return
+
+        existing = {c.license_number: c for c in Customer.objects.filter(license_number__in=by_license)}
 
         to_create: list[Customer] = []
         to_update: list[Customer] = []
-        update_fields = (
-            "full_name",
-            "birth_date",
-            "email",
-            "phone",
-            "license_issued_by",
-            "driving_since",
-            "registration_address",
-            "passport_series",
-            "passport_number",
-            "passport_issued_by",
-            "passport_issue_date",
-            "discount_percent",
-        )
-
         for license_number, data in by_license.items():
             if license_number in existing:
                 customer = existing[license_number]
-                changed = False
-                for field in update_fields:
-                    new_value = data.get(field)
-                    if getattr(customer, field) != new_value:
-                        setattr(customer, field, new_value)
-                        changed = True
-                if changed:
+                new_values = tuple(data.get(field) for field in views.CUSTOMER_IMPORT_UPDATE_FIELDS)
+                if views._customer_import_values(customer) != new_values:  # noqa: SLF001
+                    for field, value in zip(views.CUSTOMER_IMPORT_UPDATE_FIELDS, new_values):
+                        setattr(customer, field, value)
                     to_update.append(customer)
             else:
                 payload = {key: value for key, value in data.items() if key != "tags"}
@@ -109,7 +87,7 @@ class Command(BaseCommand):
                 if to_update:
                     Customer.objects.bulk_update(
                         to_update,
-                        update_fields,
+                        views.CUSTOMER_IMPORT_UPDATE_FIELDS,
                         batch_size=views.IMPORT_BATCH_SIZE,
                     )
                     updated_count = len(to_update)
@@ -117,10 +95,8 @@ class Command(BaseCommand):
         # Apply tag updates even when field values did not change,
         # so re-importing the same file can still fix tag sync issues.
         if tags_by_license:
-            views._sync_customer_tags(  # noqa: SLF001 - reuse importer
-                {license_number: existing.get(license_number) for license_number in licenses},
-                tags_by_license,
-            )
+            # `existing` now maps every imported license (old and new) to its customer.
+            views._sync_customer_tags(existing, tags_by_license)  # noqa: SLF001 - reuse importer
 
         imported = created_count + updated_count
 
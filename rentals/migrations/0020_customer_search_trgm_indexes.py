@@ -0,0 +1,47 @@
+from django.db import migrations
+
+# Columns the customer list and the customer lookup endpoint search with icontains.
+CUSTOMER_SEARCH_COLUMNS = (
+    "full_name",
+    "phone",
+    "email",
+    "license_number",
+    "license_issued_by",
+    "registration_address",
+    "passport_series",
+    "passport_number",
+    "passport_issued_by",
+)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    # icontains compiles to UPPER(col::text) LIKE UPPER('%term%') on PostgreSQL,
+    # so index the same expressions with gin_trgm_ops to serve those scans.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    customer_columns = ", ".join(f"UPPER({column}::text) gin_trgm_ops" for column in CUSTOMER_SEARCH_COLUMNS)
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS customer_search_trgm ON rentals_customer USING gin ({customer_columns})"
+    )
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS customertag_name_trgm ON rentals_customertag "
+        "USING gin (UPPER(name::text) gin_trgm_ops)"
+    )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS customer_search_trgm")
+    schema_editor.execute("DROP INDEX IF EXISTS customertag_name_trgm")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("rentals", "0019_alter_customer_driving_since"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
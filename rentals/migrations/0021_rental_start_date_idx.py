@@ -0,0 +1,14 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("rentals", "0020_customer_search_trgm_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="rental",
+            index=models.Index(fields=["start_date"], name="rental_start_date_idx"),
+        ),
+    ]
@@ -0,0 +1,52 @@
+import re
+
+from django.db import migrations, models
+
+PLATE_NOISE_RE = re.compile(r"[^0-9A-ZА-ЯЁ]")
+
+
+def fill_plate_normalized(apps, schema_editor):
+    Car = apps.get_model("rentals", "Car")
+    cars = list(Car.objects.only("id", "plate_number"))
+    for car in cars:
+        car.plate_normalized = PLATE_NOISE_RE.sub("", (car.plate_number or "").upper())
+    Car.objects.bulk_update(cars, ["plate_normalized"], batch_size=1000)
+
+
+def create_plate_trigram_index(apps, schema_editor):
+    # The car list filters with plate_normalized LIKE '%term%'; pg_trgm comes from 0020.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS car_plate_normalized_trgm ON rentals_car "
+        "USING gin (plate_normalized gin_trgm_ops)"
+    )
+
+
+def drop_plate_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS car_plate_normalized_trgm")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("rentals", "0021_rental_start_date_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="car",
+            name="plate_normalized",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                help_text="Госномер без пробелов и разделителей; заполняется автоматически.",
+                max_length=20,
+                verbose_name="Госномер для поиска",
+            ),
+        ),
+        migrations.RunPython(fill_plate_normalized, migrations.RunPython.noop),
+        migrations.RunPython(create_plate_trigram_index, drop_plate_trigram_index),
+    ]
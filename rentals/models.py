@@ -1,4 +1,5 @@
 import random
+import re
 from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
 
 from django.db import IntegrityError, models
@@ -33,6 +34,19 @@ MILEAGE_LIMIT_CHOICES = [
 ]
 
 
+_PLATE_NOISE_RE = re.compile(r"[^0-9A-ZА-ЯЁ]")
+
+
+def normalize_plate(value: str | None) -> str:
+    """Upper-case a plate number and drop everything but letters and digits."""
+    return _PLATE_NOISE_RE.sub("", (value or "").upper())
+
+
+def car_label(plate_number, make, model, year) -> str:
+    """Display label for a car; Car.__str__ and value()-based payloads share it."""
+    return f"{plate_number} - {make} {model} ({year})"
+
+
 def _format_money_words(value: Decimal | None) -> str:
     if value is None:
         return ""
@@ -50,6 +64,14 @@ def _format_money_words(value: Decimal | None) -> str:
 
 class Car(models.Model):
     plate_number = models.CharField("Госномер", max_length=20, unique=True)
+    plate_normalized = models.CharField(
+        "Госномер для поиска",
+        max_length=20,
+        blank=True,
+        default="",
+        editable=False,
+        help_text="Госномер без пробелов и разделителей; заполняется автоматически.",
+    )
     make = models.CharField("Марка", max_length=50)
     model = models.CharField("Модель", max_length=50)
     year = models.PositiveIntegerField("Год выпуска")
@@ -228,7 +250,14 @@ class Car(models.Model):
         verbose_name_plural = "Автомобили"
 
     def __str__(self):
-        return f"{self.plate_number} - {self.make} {self.model} ({self.year})"
+        return car_label(self.plate_number, self.make, self.model, self.year)
+
+    def save(self, *args, **kwargs):
+        self.plate_normalized = normalize_plate(self.plate_number)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "plate_number" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "plate_normalized"}
+        return super().save(*args, **kwargs)
 
     @property
     def label(self) -> str:
@@ -488,6 +517,10 @@ class Rental(models.Model):
     class Meta:
         verbose_name = "Аренда"
         verbose_name_plural = "Аренды"
+        indexes = [
+            # The dashboard trend only aggregates rentals from the last few months.
+            models.Index(fields=["start_date"], name="rental_start_date_idx"),
+        ]
 
     def __str__(self):
         return self.deal_name
@@ -507,6 +540,27 @@ class Rental(models.Model):
                 return candidate
         raise RuntimeError("Не удалось сгенерировать уникальный номер договора.")
 
+    @classmethod
+    def generate_unique_contract_numbers(cls, count: int, exclude=()) -> list[str]:
+        """
+        Generate ``count`` distinct free numbers, checking candidates in batches
+        instead of one query per number. ``exclude`` holds numbers already claimed
+        by unsaved rentals.
+        """
+        numbers: set[str] = set()
+        excluded = set(exclude)
+        stalled = 0
+        while len(numbers) < count:
+            if stalled >= 50:
+                raise RuntimeError("Не удалось сгенерировать уникальный номер договора.")
+            needed = min(count - len(numbers), 1000)
+            candidates = {cls._generate_contract_number() for _ in range(needed * 2)} - numbers - excluded
+            taken = set(cls.objects.filter(contract_number__in=candidates).values_list("contract_number", flat=True))
+            fresh = list(candidates - taken)[:needed]
+            stalled = 0 if fresh else stalled + 1
+            numbers.update(fresh)
+        return list(numbers)
+
     def ensure_contract_number(self, force: bool = False):
         """
         Make sure the rental has a contract number before saving.
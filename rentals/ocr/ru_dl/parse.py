@@ -38,6 +38,11 @@ STOPWORDS = (
 NAME_CLEAN_RE = re.compile(r"[^A-Za-z\u0410-\u044f\u0401\u0451\s-]")
 
 ISSUER_CLEAN_RE = re.compile(r"[^0-9\u0410-\u044f\u0401\u0451\s-]")
+ISSUER_MARKERS = (
+    "\u0413\u0418\u0411\u0414\u0414",  # ГИБДД
+    "\u041c\u0420\u042d\u041e",  # МРЭО
+)
+DIGIT_RE = re.compile(r"\d")
 
 RU_MONTH_RE = re.compile(
     r"\b(январ|янв|феврал|фев|март|мар|апрел|апр|ма[йя]|июн|июл|август|авг|"
@@ -386,7 +391,7 @@ def _name_quality(text: str) -> float:
     cleaned = re.sub(r"\s+", " ", cleaned).strip()
     if not cleaned:
         return 0.0
-    if re.search(r"\d", cleaned):
+    if DIGIT_RE.search(cleaned):
         return 0.0
     upper = cleaned.upper()
     if any(word in upper for word in STOPWORDS):
@@ -405,7 +410,7 @@ def parse_front(rois: dict, context_text: str | None = None) -> dict[str, tuple[
     patronymic = _normalize_name_line(_roi_text(rois, "patronymic"))
     full_name_line = _normalize_name_line(_roi_text(rois, "full_name_line"))
 
-    if re.search(r"\d", patronymic):
+    if DIGIT_RE.search(patronymic):
         patronymic = ""
 
     name_parts = [part for part in (surname, name, patronymic) if part]
@@ -455,7 +460,7 @@ def parse_front(rois: dict, context_text: str | None = None) -> dict[str, tuple[
     license_issued_by_conf = _roi_conf(rois, "license_issued_by")
     if license_issued_by:
         upper = license_issued_by.upper()
-        if not any(marker in upper for marker in ("\u0413\u0418\u0411\u0414\u0414", "\u041c\u0420\u042d\u041e")):
+        if not any(marker in upper for marker in ISSUER_MARKERS):
             license_issued_by = None
             license_issued_by_conf = 0.0
 
@@ -508,7 +513,7 @@ def parse_front_from_text(raw_text: str | None, base_conf: float | None = None)
         normalized = _clean_name_line(line)
         if not normalized:
             return False
-        if re.search(r"\d", line):
+        if DIGIT_RE.search(line):
             return False
         if any(word in upper_line for word in STOPWORDS):
             return False
@@ -0,0 +1,36 @@
+"""Cache keys and invalidation helpers for data reused across requests."""
+
+from django.core.cache import cache
+
+CAR_PRICING_CACHE_KEY = "rentals:car_pricing:v1"
+CONTRACT_TEMPLATES_CACHE_KEY = "rentals:contract_templates:v1"
+CUSTOMER_TAGS_CACHE_KEY = "rentals:customer_tags:v1"
+DASHBOARD_CACHE_KEY = "rentals:dashboard:v1"
+# The default cache is per-process LocMemCache: signals and explicit invalidation
+# only clear the current process, while other gunicorn workers and management
+# commands write through their own. Cached lookups therefore expire on their own
+# so such writes show up within a minute.
+LOOKUP_CACHE_TIMEOUT = 60
+# The dashboard also goes stale through bulk writes that send no signals
+# (and through other processes), so it expires on its own as well.
+DASHBOARD_CACHE_TIMEOUT = 300
+
+
+def invalidate_car_pricing():
+    """Drop the cached car pricing payload used by the rental forms."""
+    cache.delete(CAR_PRICING_CACHE_KEY)
+
+
+def invalidate_contract_templates():
+    """Drop the cached contract template choices shown on rental pages."""
+    cache.delete(CONTRACT_TEMPLATES_CACHE_KEY)
+
+
+def invalidate_customer_tags():
+    """Drop the cached tag list used by the customer list filter."""
+    cache.delete(CUSTOMER_TAGS_CACHE_KEY)
+
+
+def invalidate_dashboard():
+    """Drop the cached dashboard aggregates."""
+    cache.delete(DASHBOARD_CACHE_KEY)
@@ -25,12 +25,14 @@ def rentals_summary():
     }
 
 
-def car_utilization():
+def car_utilization(limit=None):
     """
     Simplified utilization: number of completed rentals and revenue by car.
 
     A more precise metric would look at day-level utilization, but for now we
-    count completed rentals per car to highlight top performers.
+    count completed rentals per car to highlight top performers. ``limit`` keeps
+    only the top cars and is applied in the query. The result is always a plain
+    list of dicts, so callers can cache it.
     """
     qs = (
         Rental.objects.filter(status="completed")
@@ -38,6 +40,8 @@ def car_utilization():
         .annotate(num_rentals=Count("id"), revenue=Sum("total_price"))
         .order_by("-num_rentals")
     )
+    if limit is not None:
+        qs = qs[:limit]
     return list(qs)
 
 
@@ -0,0 +1,37 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Car, ContractTemplate, Customer, CustomerTag, Rental
+from .services.caching import (
+    invalidate_car_pricing,
+    invalidate_contract_templates,
+    invalidate_customer_tags,
+    invalidate_dashboard,
+)
+
+
+@receiver(post_save, sender=Car)
+@receiver(post_delete, sender=Car)
+def _car_changed(sender, **kwargs):
+    invalidate_car_pricing()
+    invalidate_dashboard()
+
+
+@receiver(post_save, sender=Customer)
+@receiver(post_delete, sender=Customer)
+@receiver(post_save, sender=Rental)
+@receiver(post_delete, sender=Rental)
+def _dashboard_data_changed(sender, **kwargs):
+    invalidate_dashboard()
+
+
+@receiver(post_save, sender=ContractTemplate)
+@receiver(post_delete, sender=ContractTemplate)
+def _contract_template_changed(sender, **kwargs):
+    invalidate_contract_templates()
+
+
+@receiver(post_save, sender=CustomerTag)
+@receiver(post_delete, sender=CustomerTag)
+def _customer_tag_changed(sender, **kwargs):
+    invalidate_customer_tags()
@@ -0,0 +1,54 @@
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.contrib.messages import get_messages
+from django.test import TestCase
+from django.urls import reverse
+
+from rentals.models import Car, Customer, CustomerTag, Rental
+
+
+class DeleteAllTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="tester", password="pass")
+        self.client.force_login(self.user)
+        self.car = Car.objects.create(
+            plate_number="A111AA77", make="Kia", model="Rio", year=2020, daily_rate=Decimal("2000")
+        )
+        self.renter = Customer.objects.create(
+            full_name="Ivanov Ivan", phone="79990001122", license_number="1122333444"
+        )
+        self.second_driver = Customer.objects.create(
+            full_name="Petrov Petr", phone="79990002233", license_number="2233444555"
+        )
+        Rental.objects.create(
+            car=self.car,
+            customer=self.renter,
+            second_driver=self.second_driver,
+            start_date=date(2024, 5, 1),
+            end_date=date(2024, 5, 4),
+            daily_rate=Decimal("2000"),
+            total_price=Decimal("6000"),
+        )
+
+    def test_customer_delete_all_keeps_renters_and_second_drivers(self):
+        idle = Customer.objects.create(full_name="Sidorov Sidor", phone="79990003344", license_number="3344555666")
+        idle.tags.add(CustomerTag.objects.create(name="vip"))
+
+        response = self.client.post(reverse("rentals:customer_delete_all"))
+
+        self.assertRedirects(response, reverse("rentals:customer_list"), fetch_redirect_response=False)
+        self.assertEqual(list(Customer.objects.order_by("pk")), [self.renter, self.second_driver])
+        messages = [str(message) for message in get_messages(response.wsgi_request)]
+        self.assertIn("Удалено клиентов: 1.", messages)
+        self.assertIn("Пропущено клиентов, связанных с арендами: 2.", messages)
+
+    def test_car_delete_all_skips_cars_with_rentals(self):
+        Car.objects.create(plate_number="B222BB77", make="Lada", model="Vesta", year=2021, daily_rate=Decimal("1500"))
+
+        response = self.client.post(reverse("rentals:car_delete_all"))
+
+        self.assertEqual(list(Car.objects.all()), [self.car])
+        messages = [str(message) for message in get_messages(response.wsgi_request)]
+        self.assertIn("Удалено автомобилей: 1.", messages)
@@ -0,0 +1,86 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from rentals.models import Car, ContractTemplate, Customer, CustomerTag
+from rentals.services.caching import DASHBOARD_CACHE_KEY
+from rentals.views import _car_pricing_payload, _contract_template_choices, _customer_tag_choices
+
+
+class CarPricingPayloadTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_payload_is_refreshed_when_a_car_changes(self):
+        car = Car.objects.create(plate_number="A111AA77", make="Kia", model="Rio", year=2020, daily_rate=Decimal("2000"))
+
+        payload = _car_pricing_payload()
+        self.assertEqual(payload[0]["label"], str(car))
+        self.assertEqual(payload[0]["daily_rate"], 2000.0)
+
+        with self.assertNumQueries(0):
+            _car_pricing_payload()
+
+        car.daily_rate = Decimal("2500")
+        car.save()
+        self.assertEqual(_car_pricing_payload()[0]["daily_rate"], 2500.0)
+
+        car.delete()
+        self.assertEqual(_car_pricing_payload(), [])
+
+
+class ContractTemplateChoicesTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_choices_follow_template_changes(self):
+        template = ContractTemplate.objects.create(name="Договор", body_html="<p></p>")
+        self.assertEqual(_contract_template_choices(), [{"pk": template.pk, "name": "Договор"}])
+
+        with self.assertNumQueries(0):
+            _contract_template_choices()
+
+        template.delete()
+        self.assertEqual(_contract_template_choices(), [])
+
+
+class CustomerTagChoicesTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_choices_follow_tag_changes(self):
+        tag = CustomerTag.objects.create(name="vip")
+        self.assertEqual(_customer_tag_choices(), [{"id": tag.pk, "name": "vip"}])
+
+        with self.assertNumQueries(0):
+            _customer_tag_choices()
+
+        CustomerTag.objects.create(name="blacklist")
+        self.assertEqual([item["name"] for item in _customer_tag_choices()], ["blacklist", "vip"])
+
+        tag.delete()
+        self.assertEqual([item["name"] for item in _customer_tag_choices()], ["blacklist"])
+
+
+class DashboardCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(username="tester", password="pass")
+        self.client.force_login(self.user)
+
+    def test_dashboard_is_cached_until_data_changes(self):
+        url = reverse("rentals:dashboard")
+        self.assertEqual(self.client.get(url).context["customers_count"], 0)
+        self.assertIsNotNone(cache.get(DASHBOARD_CACHE_KEY))
+
+        Customer.objects.create(full_name="Ivanov Ivan", phone="79990001122", license_number="1122333444")
+
+        self.assertEqual(self.client.get(url).context["customers_count"], 1)
+
+    def test_cached_dashboard_holds_plain_lists(self):
+        self.client.get(reverse("rentals:dashboard"))
+
+        self.assertIsInstance(cache.get(DASHBOARD_CACHE_KEY)["top_cars"], list)
@@ -0,0 +1,34 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rentals.models import Car
+
+
+class CarListSearchTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="tester", password="pass")
+        self.client.force_login(self.user)
+        self.url = reverse("rentals:car_list")
+
+    def test_search_ignores_case_and_separators_in_plates(self):
+        car = Car.objects.create(plate_number="a 111-aa 77", make="Kia", model="Rio", year=2020, daily_rate=Decimal("2000"))
+        Car.objects.create(plate_number="B222BB77", make="Lada", model="Vesta", year=2021, daily_rate=Decimal("1500"))
+
+        response = self.client.get(self.url, {"q": "111 AA"})
+
+        self.assertEqual(car.plate_normalized, "A111AA77")
+        self.assertEqual(list(response.context["object_list"]), [car])
+
+    def test_search_of_separators_only_returns_nothing(self):
+        Car.objects.create(plate_number="A111AA77", make="Kia", model="Rio", year=2020, daily_rate=Decimal("2000"))
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, {"q": " - / "})
+
+        self.assertEqual(list(response.context["object_list"]), [])
+        self.assertFalse(any("rentals_car" in query["sql"] for query in queries.captured_queries))
@@ -2,7 +2,7 @@ from django.contrib.auth import get_user_model
 from django.test import TestCase
 from django.urls import reverse
 
-from rentals.models import Customer
+from rentals.models import Customer, CustomerTag
 
 
 class CustomerSearchTests(TestCase):
@@ -23,3 +23,30 @@ class CustomerSearchTests(TestCase):
         names = [item["name"] for item in payload["results"]]
 
         self.assertIn("Ivanov Ivan Ivanovich", names)
+
+    def test_search_by_tag_returns_customer_once(self):
+        customer = Customer.objects.create(full_name="Petrov Petr", phone="79990002233", license_number="22 33 444555")
+        customer.tags.add(CustomerTag.objects.create(name="vip"), CustomerTag.objects.create(name="vip-corp"))
+
+        response = self.client.get(self.url, {"q": "vip"})
+
+        self.assertEqual([item["id"] for item in response.json()["results"]], [customer.id])
+
+
+class CustomerListTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="tester", password="pass")
+        self.client.force_login(self.user)
+        self.url = reverse("rentals:customer_list")
+
+    def test_tag_filters_list_each_customer_once(self):
+        customer = Customer.objects.create(full_name="Petrov Petr", phone="79990002233", license_number="22 33 444555")
+        vip, corp = CustomerTag.objects.create(name="vip"), CustomerTag.objects.create(name="vip-corp")
+        customer.tags.add(vip, corp)
+        Customer.objects.create(full_name="Ivanov Ivan", phone="79990001122", license_number="11 22 333444")
+
+        by_term = self.client.get(self.url, {"q": "vip"})
+        by_tag = self.client.get(self.url, {"tag": [vip.pk, corp.pk]})
+
+        self.assertEqual(list(by_term.context["object_list"]), [customer])
+        self.assertEqual(list(by_tag.context["object_list"]), [customer])
@@ -0,0 +1,64 @@
+import csv
+import io
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from rentals.models import Car, Customer, CustomerTag, Rental
+
+
+class CsvExportTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="tester", password="pass")
+        self.client.force_login(self.user)
+
+    def _read_csv(self, response):
+        body = b"".join(response.streaming_content).decode("utf-8")
+        return list(csv.reader(io.StringIO(body)))
+
+    def test_customers_export_streams_rows_with_tags(self):
+        customer = Customer.objects.create(
+            full_name="Ivanov Ivan",
+            phone="79990001122",
+            license_number="11 22 333444",
+        )
+        customer.tags.add(CustomerTag.objects.create(name="vip"), CustomerTag.objects.create(name="corp"))
+
+        response = self.client.get(reverse("rentals:export_customers_csv"))
+
+        self.assertTrue(response.streaming)
+        self.assertIn("attachment;", response["Content-Disposition"])
+        rows = self._read_csv(response)
+        self.assertEqual(rows[0][0], "ФИО")
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[1][0], "Ivanov Ivan")
+        self.assertEqual(rows[1][-1], "corp; vip")
+
+    def test_rentals_export_reads_projected_columns_only(self):
+        car = Car.objects.create(plate_number="A111AA77", make="Kia", model="Rio", year=2020, daily_rate=Decimal("2000"))
+        customer = Customer.objects.create(full_name="Ivanov Ivan", phone="79990001122", license_number="1122333444")
+        Rental.objects.create(
+            car=car,
+            customer=customer,
+            start_date=date(2024, 5, 1),
+            end_date=date(2024, 5, 4),
+            daily_rate=Decimal("2000"),
+            total_price=Decimal("6000"),
+        )
+
+        response = self.client.get(reverse("rentals:export_rentals_csv"))
+        # Rows are fetched while streaming; touching a deferred field would add a query per rental.
+        with self.assertNumQueries(1):
+            rows = self._read_csv(response)
+
+        self.assertEqual(rows[1][1:4], ["A111AA77", "1122333444", "Ivanov Ivan"])
+
+    def test_cars_export_writes_empty_cells_for_missing_values(self):
+        Car.objects.create(plate_number="A111AA77", make="Kia", model="Rio", year=2020, daily_rate=Decimal("2000"))
+
+        rows = self._read_csv(self.client.get(reverse("rentals:export_cars_csv")))
+
+        self.assertEqual(rows[1][:5], ["A111AA77", "Kia", "Rio", "2020", ""])
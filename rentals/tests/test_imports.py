@@ -0,0 +1,250 @@
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.contrib.messages import get_messages
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rentals import views
+from rentals.models import Car, Customer, CustomerTag, Rental
+
+
+class CarImportTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="tester", password="pass")
+        self.client.force_login(self.user)
+        self.url = reverse("rentals:import_cars_csv")
+
+    def _upload(self, text):
+        upload = SimpleUploadedFile("cars.csv", text.encode("utf-8"), content_type="text/csv")
+        return self.client.post(self.url, {"file": upload})
+
+    def test_import_page_renders_headers_and_back_link(self):
+        response = self.client.get(self.url)
+
+        self.assertContains(response, "Регистрационный знак")
+        self.assertContains(response, f'href="{reverse("rentals:car_list")}"')
+
+    def test_import_upserts_by_plate_without_clearing_missing_fields(self):
+        Car.objects.create(
+            plate_number="A111AA77",
+            make="Kia",
+            model="Rio",
+            year=2019,
+            color="Белый",
+            daily_rate=Decimal("1500"),
+        )
+
+        response = self._upload(
+            "plate_number,make,model,year,color,daily_rate\n"
+            "A111AA77,Kia,Rio,2020,,2500\n"
+            "B222BB77,Hyundai,Solaris,2021,Серый,2000\n"
+            "B222BB77,Hyundai,Solaris,2021,,2100\n"
+            "C333CC77,Lada,,2018,,1000\n"
+        )
+
+        self.assertRedirects(response, reverse("rentals:car_list"), fetch_redirect_response=False)
+        self.assertEqual(Car.objects.count(), 2)
+
+        updated = Car.objects.get(plate_number="A111AA77")
+        self.assertEqual(updated.year, 2020)
+        self.assertEqual(updated.color, "Белый")
+        self.assertEqual(updated.daily_rate, Decimal("2500"))
+
+        created = Car.objects.get(plate_number="B222BB77")
+        self.assertEqual(created.color, "Серый")
+        self.assertEqual(created.plate_normalized, "B222BB77")
+        self.assertEqual(created.daily_rate, Decimal("2100"))
+
+    def test_reimporting_unchanged_cars_writes_nothing(self):
+        rows = "plate_number,make,model,year,color,daily_rate\nA111AA77,Kia,Rio,2020,Белый,2500\n"
+        self._upload(rows)
+
+        with CaptureQueriesContext(connection) as queries:
+            self._upload(rows)
+
+        self.assertFalse(any(query["sql"].startswith("INSERT") for query in queries.captured_queries))
+        self.assertEqual(Car.objects.get().daily_rate, Decimal("2500"))
+
+    def test_normalize_reads_loss_fee_header_variants(self):
+        row = {
+            "plate_number": "A111AA77",
+            "make": "Kia",
+            "model": "Rio",
+            "year": "2020",
+            "daily_rate": "2500",
+            "стоимость при утере гос. номера": "3000",
+            "GPS": "7000",
+        }
+
+        normalized = views._normalize_car_row(row)
+
+        self.assertEqual(normalized["loss_license_plate_fee"], Decimal("3000"))
+        self.assertEqual(normalized["loss_gps_fee"], Decimal("7000"))
+        self.assertIsNone(normalized["loss_jack_fee"])
+
+    def test_headers_match_regardless_of_case_and_yo(self):
+        row = {
+            "ГОС.НОМЕРА": "a111aa77",
+            "марка": "Kia Rio",
+            "год выпуска": "2020",
+            "Объём бака": "50",
+            "daily_rate": "2500",
+        }
+
+        normalized = views._normalize_car_row(row)
+
+        self.assertEqual(normalized["plate_number"], "A111AA77")
+        self.assertEqual((normalized["make"], normalized["model"]), ("Kia", "Rio"))
+        self.assertEqual(normalized["fuel_tank_volume_liters"], 50)
+
+    def test_bad_byte_past_first_buffer_reports_error_and_saves_nothing(self):
+        # The Cyrillic cells make this cp1251; 0x98 is undefined there and sits
+        # well past the 8 KB the reader decodes for the first row.
+        rows = "".join(f"A{n:03d}AA77,Лада,Веста,2020,Белый,1500\n" for n in range(400))
+        payload = ("plate_number,make,model,year,color,daily_rate\n" + rows).encode("cp1251")
+        payload += b"X999XX77,\x98,Rio,2020,,1500\n"
+        upload = SimpleUploadedFile("cars.csv", payload, content_type="text/csv")
+
+        # Small chunks: earlier ones are written before the bad row and must roll back.
+        with patch.object(views, "CAR_IMPORT_BATCH_SIZE", 100):
+            response = self.client.post(self.url, {"file": upload})
+
+        self.assertRedirects(response, self.url, fetch_redirect_response=False)
+        self.assertEqual(Car.objects.count(), 0)
+        messages = [str(message) for message in get_messages(response.wsgi_request)]
+        self.assertEqual(messages, ["Не удалось прочитать файл. Проверьте формат и кодировку."])
+
+
+class RentalImportTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="tester", password="pass")
+        self.client.force_login(self.user)
+
+    def test_import_matches_cars_and_customers_by_key(self):
+        car = Car.objects.create(plate_number="A111AA77", make="Kia", model="Rio", year=2020, daily_rate=Decimal("2000"))
+        customer = Customer.objects.create(full_name="Ivanov Ivan", phone="79990001122", license_number="1122333444")
+        upload = SimpleUploadedFile(
+            "rentals.csv",
+            (
+                "car_plate_number,customer_license_number,start_date,end_date,daily_rate\n"
+                "A111AA77,1122333444,2024-05-01,2024-05-04,2000\n"
+                "Z999ZZ99,1122333444,2024-05-01,2024-05-04,2000\n"
+            ).encode("utf-8"),
+            content_type="text/csv",
+        )
+
+        self.client.post(reverse("rentals:import_rentals_csv"), {"file": upload})
+
+        rental = Rental.objects.get()
+        self.assertEqual(rental.car, car)
+        self.assertEqual(rental.customer, customer)
+
+    def test_import_updates_existing_rentals_and_numbers_new_ones(self):
+        car = Car.objects.create(plate_number="A111AA77", make="Kia", model="Rio", year=2020, daily_rate=Decimal("2000"))
+        customer = Customer.objects.create(full_name="Ivanov Ivan", phone="79990001122", license_number="1122333444")
+        existing = Rental.objects.create(
+            car=car,
+            customer=customer,
+            start_date=date(2024, 5, 1),
+            end_date=date(2024, 5, 4),
+            daily_rate=Decimal("2000"),
+            total_price=Decimal("6000"),
+            contract_number="11111",
+        )
+        upload = SimpleUploadedFile(
+            "rentals.csv",
+            (
+                "car_plate_number,customer_license_number,start_date,end_date,daily_rate,contract_number,status\n"
+                "A111AA77,1122333444,2024-05-01,2024-05-04,2500,,active\n"
+                "A111AA77,1122333444,2024-06-01,2024-06-03,2000,11111,\n"
+                "A111AA77,1122333444,2024-07-01,2024-07-03,2000,22222,\n"
+            ).encode("utf-8"),
+            content_type="text/csv",
+        )
+
+        self.client.post(reverse("rentals:import_rentals_csv"), {"file": upload})
+
+        existing.refresh_from_db()
+        self.assertEqual((existing.daily_rate, existing.status, existing.contract_number), (Decimal("2500"), "active", "11111"))
+        june = Rental.objects.get(start_date=date(2024, 6, 1))
+        self.assertNotIn(june.contract_number, (None, "", "11111"))
+        self.assertEqual(Rental.objects.get(start_date=date(2024, 7, 1)).contract_number, "22222")
+
+    def test_rows_repeated_across_chunks_update_one_rental(self):
+        Car.objects.create(plate_number="A111AA77", make="Kia", model="Rio", year=2020, daily_rate=Decimal("2000"))
+        Customer.objects.create(full_name="Ivanov Ivan", phone="79990001122", license_number="1122333444")
+        upload = SimpleUploadedFile(
+            "rentals.csv",
+            (
+                "car_plate_number,customer_license_number,start_date,end_date,daily_rate\n"
+                "A111AA77,1122333444,2024-05-01,2024-05-04,2000\n"
+                "A111AA77,1122333444,2024-05-01,2024-05-04,2200\n"
+            ).encode("utf-8"),
+            content_type="text/csv",
+        )
+
+        with patch.object(views, "IMPORT_BATCH_SIZE", 1):
+            self.client.post(reverse("rentals:import_rentals_csv"), {"file": upload})
+
+        self.assertEqual(Rental.objects.get().daily_rate, Decimal("2200"))
+
+
+class CustomerImportTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="tester", password="pass")
+        self.client.force_login(self.user)
+
+    def test_import_links_each_tag_once(self):
+        upload = SimpleUploadedFile(
+            "customers.csv",
+            "ФИО,Телефон,Номер ВУ,Теги\nIvanov Ivan,79990001122,1122333444,\"vip, corp; vip\"\n".encode("utf-8"),
+            content_type="text/csv",
+        )
+
+        self.client.post(reverse("rentals:import_customers_csv"), {"file": upload})
+
+        customer = Customer.objects.get(license_number="1122333444")
+        self.assertEqual(list(customer.tags.values_list("name", flat=True)), ["corp", "vip"])
+
+    def test_bad_byte_past_first_buffer_reports_error_and_saves_nothing(self):
+        rows = "".join(f"Иванов Иван,7999000{n:04d},11223{n:05d}\n" for n in range(400))
+        payload = ("ФИО,Телефон,Номер ВУ\n" + rows).encode("cp1251") + b"\x98,79990009999,9999999999\n"
+        upload = SimpleUploadedFile("customers.csv", payload, content_type="text/csv")
+
+        response = self.client.post(reverse("rentals:import_customers_csv"), {"file": upload})
+
+        self.assertRedirects(response, reverse("rentals:import_customers_csv"), fetch_redirect_response=False)
+        self.assertFalse(Customer.objects.exists())
+        messages = [str(message) for message in get_messages(response.wsgi_request)]
+        self.assertEqual(messages, ["Не удалось прочитать файл. Проверьте формат и кодировку."])
+
+    def test_tag_sync_only_changes_the_delta(self):
+        customer = Customer.objects.create(full_name="Ivanov Ivan", phone="79990001122", license_number="1122333444")
+        vip, old = CustomerTag.objects.create(name="vip"), CustomerTag.objects.create(name="old")
+        customer.tags.add(vip, old)
+        through = Customer.tags.through
+        vip_link = through.objects.get(customer=customer, customertag=vip).pk
+
+        views._sync_customer_tags({"1122333444": customer}, {"1122333444": ["vip", "corp"]})
+
+        self.assertEqual(list(customer.tags.values_list("name", flat=True)), ["corp", "vip"])
+        self.assertTrue(through.objects.filter(pk=vip_link).exists())
+
+
+class ParseDateTests(SimpleTestCase):
+    def test_accepts_iso_and_day_first_formats(self):
+        self.assertEqual(views._parse_date("2024-05-01"), date(2024, 5, 1))
+        self.assertEqual(views._parse_date("1.2.2020"), date(2020, 2, 1))
+        self.assertEqual(views._parse_date("01/02/2020"), date(2020, 2, 1))
+        self.assertEqual(views._parse_date("01-02-2020"), date(2020, 2, 1))
+
+    def test_rejects_mixed_separators_and_invalid_days(self):
+        self.assertIsNone(views._parse_date("01.02/2020"))
+        self.assertIsNone(views._parse_date("31.02.2020"))
+        self.assertIsNone(views._parse_date("2020"))
@@ -10,6 +10,18 @@ from rentals.ocr.ru_dl.parse import (
 
 
 class OCRParseTests(SimpleTestCase):
+    _STATUS_BASE = (
+        ("full_name", "Ivanov Ivan", 0.92),
+        ("birth_date", "1990-05-12", 0.88),
+        ("license_number", "12 34 567890", 0.9),
+    )
+
+    def _status_fields(self, **overrides):
+        fields = {name: {"value": value, "confidence": confidence} for name, value, confidence in self._STATUS_BASE}
+        for name, changes in overrides.items():
+            fields[name] = {**fields[name], **changes}
+        return fields
+
     def test_normalize_date(self):
         self.assertEqual(normalize_date("12.05.1990"), "1990-05-12")
         self.assertEqual(normalize_date("01/02/05"), "2005-02-01")
@@ -31,23 +43,18 @@ class OCRParseTests(SimpleTestCase):
         self.assertEqual(parse_categories(text), ["A", "B", "C1", "BE", "M"])
 
     def test_status_logic(self):
-        fields = {
-            "full_name": {"value": "Ivanov Ivan", "confidence": 0.92},
-            "birth_date": {"value": "1990-05-12", "confidence": 0.88},
-            "license_number": {"value": "12 34 567890", "confidence": 0.9},
-        }
-        status, missing, low_conf = determine_status(fields)
+        status, missing, low_conf = determine_status(self._status_fields())
         self.assertEqual(status, "ok")
         self.assertEqual(missing, [])
         self.assertEqual(low_conf, [])
 
-        fields["license_number"]["confidence"] = 0.5
-        status, _, low_conf = determine_status(fields)
+        status, _, low_conf = determine_status(self._status_fields(license_number={"confidence": 0.5}))
         self.assertEqual(status, "partial")
         self.assertIn("license_number", low_conf)
 
-        fields["birth_date"]["value"] = None
-        status, missing, _ = determine_status(fields)
+        status, missing, _ = determine_status(
+            self._status_fields(license_number={"confidence": 0.5}, birth_date={"value": None})
+        )
         self.assertEqual(status, "partial")
         self.assertIn("birth_date", missing)
 
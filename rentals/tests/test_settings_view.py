@@ -0,0 +1,24 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+
+class SettingsAdminsTabTests(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.root = User.objects.create_superuser(username="root", password="pass")
+        self.staff = User.objects.create_user(username="manager", password="pass", is_staff=True)
+        self.hidden_root = User.objects.create_user(username="owner", password="pass", is_superuser=True)
+        User.objects.create_user(username="viewer", password="pass")
+        self.client.force_login(self.root)
+
+    def test_admins_tab_lists_staff_and_counts_all_superusers(self):
+        response = self.client.get(reverse("rentals:settings"), {"tab": "admins"})
+
+        self.assertEqual(response.context["admins"], [self.staff, self.root])
+        self.assertEqual(response.context["superuser_count"], 2)
+
+    def test_general_tab_skips_admin_queries(self):
+        response = self.client.get(reverse("rentals:settings"))
+
+        self.assertNotIn("superuser_count", response.context)
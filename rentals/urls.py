@@ -1,58 +1,21 @@
-from django.urls import path
+from django.urls import include, path
 
 from . import views
 
 app_name = "rentals"
 
+# Resource routes live in per-prefix modules so the root resolver only has to
+# match a handful of prefixes before dispatching.
 urlpatterns = [
     path("", views.dashboard, name="dashboard"),
     path("admins/", views.admin_user_list, name="admin_user_list"),
     path("admins/<int:user_id>/password/", views.admin_user_password_reset, name="admin_user_password"),
     path("admins/<int:user_id>/delete/", views.admin_user_delete, name="admin_user_delete"),
     path("account/password/", views.password_change_self, name="password_change"),
-    path("cars/", views.CarListView.as_view(), name="car_list"),
-    path("cars/new/", views.CarCreateView.as_view(), name="car_create"),
-    path("cars/<int:pk>/edit/", views.CarUpdateView.as_view(), name="car_update"),
-    path("cars/<int:pk>/delete/", views.car_delete, name="car_delete"),
-    path("cars/delete-all/", views.car_delete_all, name="car_delete_all"),
-    path("cars/export/", views.export_cars_csv, name="export_cars_csv"),
-    path("cars/import/", views.import_cars_csv, name="import_cars_csv"),
-    path("customers/", views.CustomerListView.as_view(), name="customer_list"),
-    path("customers/search/", views.customer_search, name="customer_search"),
-    path("customers/quick-create/", views.customer_quick_create, name="customer_quick_create"),
-    path("customers/<int:pk>/profile/", views.customer_profile, name="customer_profile"),
-    path("customers/new/", views.CustomerCreateView.as_view(), name="customer_create"),
-    path("customers/<int:pk>/edit/", views.CustomerUpdateView.as_view(), name="customer_update"),
-    path("customers/<int:pk>/delete/", views.customer_delete, name="customer_delete"),
-    path("customers/delete-all/", views.customer_delete_all, name="customer_delete_all"),
-    path("customers/export/", views.export_customers_csv, name="export_customers_csv"),
-    path("customers/import/", views.import_customers_csv, name="import_customers_csv"),
+    path("cars/", include("rentals.urls_cars")),
+    path("customers/", include("rentals.urls_customers")),
     path("ocr/driver-license/", views.ocr_driver_license, name="ocr_driver_license"),
-    path("rentals/", views.RentalListView.as_view(), name="rental_list"),
-    path("rentals/new/", views.RentalCreateView.as_view(), name="rental_create"),
-    path("rentals/wizard/", views.RentalWizardView.as_view(), name="rental_wizard"),
-    path("rentals/<int:pk>/edit/", views.RentalUpdateView.as_view(), name="rental_update"),
-    path("rentals/export/", views.export_rentals_csv, name="export_rentals_csv"),
-    path("rentals/import/", views.import_rentals_csv, name="import_rentals_csv"),
-    path(
-        "rentals/<int:rental_id>/contract/<int:template_id>/",
-        views.generate_contract,
-        name="generate_contract",
-    ),
-    path(
-        "contract-templates/",
-        views.ContractTemplateListView.as_view(),
-        name="contract_template_list",
-    ),
-    path(
-        "contract-templates/new/",
-        views.ContractTemplateCreateView.as_view(),
-        name="contract_template_create",
-    ),
-    path(
-        "contract-templates/<int:pk>/edit/",
-        views.ContractTemplateUpdateView.as_view(),
-        name="contract_template_update",
-    ),
+    path("rentals/", include("rentals.urls_rentals")),
+    path("contract-templates/", include("rentals.urls_templates")),
     path("settings/", views.BusinessSettingsUpdateView.as_view(), name="settings"),
 ]
@@ -0,0 +1,15 @@
+from django.urls import path
+
+from . import views
+
+_ROUTES = (
+    ("", views.CarListView.as_view(), "car_list"),
+    ("new/", views.CarCreateView.as_view(), "car_create"),
+    ("<int:pk>/edit/", views.CarUpdateView.as_view(), "car_update"),
+    ("<int:pk>/delete/", views.car_delete, "car_delete"),
+    ("delete-all/", views.car_delete_all, "car_delete_all"),
+    ("export/", views.export_cars_csv, "export_cars_csv"),
+    ("import/", views.import_cars_csv, "import_cars_csv"),
+)
+
+urlpatterns = [path(route, view, name=name) for route, view, name in _ROUTES]
@@ -0,0 +1,18 @@
+from django.urls import path
+
+from . import views
+
+_ROUTES = (
+    ("", views.CustomerListView.as_view(), "customer_list"),
+    ("search/", views.customer_search, "customer_search"),
+    ("quick-create/", views.customer_quick_create, "customer_quick_create"),
+    ("<int:pk>/profile/", views.customer_profile, "customer_profile"),
+    ("new/", views.CustomerCreateView.as_view(), "customer_create"),
+    ("<int:pk>/edit/", views.CustomerUpdateView.as_view(), "customer_update"),
+    ("<int:pk>/delete/", views.customer_delete, "customer_delete"),
+    ("delete-all/", views.customer_delete_all, "customer_delete_all"),
+    ("export/", views.export_customers_csv, "export_customers_csv"),
+    ("import/", views.import_customers_csv, "import_customers_csv"),
+)
+
+urlpatterns = [path(route, view, name=name) for route, view, name in _ROUTES]
@@ -0,0 +1,15 @@
+from django.urls import path
+
+from . import views
+
+_ROUTES = (
+    ("", views.RentalListView.as_view(), "rental_list"),
+    ("new/", views.RentalCreateView.as_view(), "rental_create"),
+    ("wizard/", views.RentalWizardView.as_view(), "rental_wizard"),
+    ("<int:pk>/edit/", views.RentalUpdateView.as_view(), "rental_update"),
+    ("export/", views.export_rentals_csv, "export_rentals_csv"),
+    ("import/", views.import_rentals_csv, "import_rentals_csv"),
+    ("<int:rental_id>/contract/<int:template_id>/", views.generate_contract, "generate_contract"),
+)
+
+urlpatterns = [path(route, view, name=name) for route, view, name in _ROUTES]
@@ -0,0 +1,11 @@
+from django.urls import path
+
+from . import views
+
+_ROUTES = (
+    ("", views.ContractTemplateListView.as_view(), "contract_template_list"),
+    ("new/", views.ContractTemplateCreateView.as_view(), "contract_template_create"),
+    ("<int:pk>/edit/", views.ContractTemplateUpdateView.as_view(), "contract_template_update"),
+)
+
+urlpatterns = [path(route, view, name=name) for route, view, name in _ROUTES]
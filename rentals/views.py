@@ -1,9 +1,15 @@
+import codecs
 import csv
+import io
 import logging
 import os
 import re
 from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain, islice
+from operator import attrgetter, itemgetter
 from urllib.parse import quote
 
 try:
@@ -19,20 +25,19 @@ except ImportError:  # pragma: no cover - optional dependency for .xlsx
 from django.contrib import messages
 from django.contrib.auth import get_user_model, update_session_auth_hash
 from django.contrib.auth.decorators import login_required
-from django.http import HttpResponse, JsonResponse
-from django.db import transaction
-from django.db.models import F, Q, Value
+from django.core.cache import cache
+from django.http import FileResponse, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.db import connection, transaction
+from django.db.models import Exists, OuterRef, Prefetch, Q
 from django.db.models.deletion import ProtectedError
-from django.db.models.functions import Replace, Upper
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse, reverse_lazy
 from django.utils.decorators import method_decorator
-from django.utils.encoding import smart_str
 from django.core.exceptions import PermissionDenied
 from django.views.generic import CreateView, ListView, UpdateView
 from django.views.decorators.http import require_POST
 
-from .car_constants import CAR_LOSS_FEE_FIELDS
+from .car_constants import CAR_LOSS_FEE_FIELDS, CAR_LOSS_FEE_NAMES
 from .forms import (
     AdminUserCreationForm,
     BusinessSettingsForm,
@@ -42,8 +47,20 @@ from .forms import (
     RentalForm,
     StyledPasswordChangeForm,
     StyledSetPasswordForm,
+    TAG_SPLIT_RE,
+)
+from .models import BusinessSettings, Car, ContractTemplate, Customer, CustomerTag, Rental, car_label, normalize_plate
+from .services.caching import (
+    CAR_PRICING_CACHE_KEY,
+    CONTRACT_TEMPLATES_CACHE_KEY,
+    CUSTOMER_TAGS_CACHE_KEY,
+    DASHBOARD_CACHE_KEY,
+    DASHBOARD_CACHE_TIMEOUT,
+    LOOKUP_CACHE_TIMEOUT,
+    invalidate_car_pricing,
+    invalidate_customer_tags,
+    invalidate_dashboard,
 )
-from .models import BusinessSettings, Car, ContractTemplate, Customer, CustomerTag, Rental
 from .services.contract_renderer import placeholder_guide, render_docx, render_html_template, render_pdf
 from .services.pricing import calculate_rental_pricing, pricing_config
 from .services.stats import (
@@ -61,6 +78,21 @@ NAME_MAX_LEN = Customer._meta.get_field("full_name").max_length
 EMAIL_MAX_LEN = Customer._meta.get_field("email").max_length
 TAG_MAX_LEN = CustomerTag._meta.get_field("name").max_length
 IMPORT_BATCH_SIZE = max(1, int(os.environ.get("IMPORT_BULK_BATCH_SIZE", "5000")))
+_DEC_ZERO = Decimal("0")
+_VALID_STATUSES = frozenset(code for code, _ in Rental.STATUS_CHOICES)
+_STATUS_LABEL_MAP = {label.lower(): code for code, label in Rental.STATUS_CHOICES}
+_STATUS_ORDER = tuple(code for code, _ in Rental.STATUS_CHOICES)
+_STATUS_CHART_LABELS = [label for _, label in Rental.STATUS_CHOICES]
+_WHITESPACE_RE = re.compile(r"\s+")
+_PHONE_SPLIT_RE = re.compile(r"[;,/\n\r]+")
+_PHONE_STRIP_RE = re.compile(r"[^0-9+]")
+# Search terms that can be a discount, e.g. "10", "7,5" or "15%".
+_NUMERIC_TERM_RE = re.compile(r"[\d.,%]+")
+# Accepted date shapes: YYYY-MM-DD and DD-MM-YYYY / DD.MM.YYYY / DD/MM/YYYY.
+_DATE_RE = re.compile(
+    r"(?:(?P<iso_year>\d{4})-(?P<iso_month>\d{1,2})-(?P<iso_day>\d{1,2})"
+    r"|(?P<day>\d{1,2})(?P<sep>[-./])(?P<month>\d{1,2})(?P=sep)(?P<year>\d{4}))"
+)
 
 logger = logging.getLogger(__name__)
 
@@ -86,19 +118,47 @@ def _parse_bool(value):
     return str(value).strip().lower() in {"true", "1", "yes", "y", "t", "да", "активен", "активный"}
 
 
+@lru_cache(maxsize=2048)
+def _decimal_from_text(text: str) -> Decimal:
+    # Rate columns repeat the same few tariffs across a fleet; Decimal is immutable, so sharing is safe.
+    return Decimal(text)
+
+
 def _parse_decimal(value):
+    if isinstance(value, int) and not isinstance(value, bool):
+        return Decimal(value)
+    if isinstance(value, float):
+        return Decimal(repr(value))
     try:
-        text = str(value).strip().replace(",", ".")
-        return Decimal(text)
+        return _decimal_from_text(str(value).strip().replace(",", "."))
     except (InvalidOperation, AttributeError, TypeError):
-        return Decimal("0")
+        return _DEC_ZERO
+
+
+def _parse_decimal_or_none(value):
+    """Parse a decimal cell, returning None when the cell is missing or empty."""
+    if value is None or value == "":
+        return None
+    return _parse_decimal(value)
+
+
+def _first_rate(*values):
+    """Return the first rate that is neither missing nor zero."""
+    for value in values:
+        if value is not None and value != _DEC_ZERO:
+            return value
+    return None
 
 
 def _parse_int(value):
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
     try:
+        if isinstance(value, float):
+            return int(value)
         text = str(value).strip().replace(",", ".")
         return int(float(text))
-    except (ValueError, TypeError, AttributeError):
+    except (ValueError, TypeError, AttributeError, OverflowError):
         return None
 
 
@@ -107,13 +167,25 @@ def _parse_date(value):
         return None
     if isinstance(value, datetime):
         return value.date()
-    text = str(value).strip()
-    for fmt in ("%d-%m-%Y", "%Y-%m-%d", "%d.%m.%Y", "%d/%m/%Y"):
-        try:
-            return datetime.strptime(text, fmt).date()
-        except ValueError:
-            continue
-    return None
+    if isinstance(value, date):
+        return value
+    return _date_from_text(str(value).strip())
+
+
+@lru_cache(maxsize=1024)
+def _date_from_text(text: str):
+    # Imports and searches repeat the same few dates, so results are memoized.
+    match = _DATE_RE.fullmatch(text)
+    if match is None:
+        return None
+    if match["iso_year"]:
+        year, month, day = match["iso_year"], match["iso_month"], match["iso_day"]
+    else:
+        year, month, day = match["year"], match["month"], match["day"]
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
 
 
 def _parse_year(value):
@@ -128,6 +200,11 @@ def _parse_year(value):
         return None
 
 
+def _is_four_digits(text: str) -> bool:
+    # Same matches as re.fullmatch(r"\d{4}", text): \d is the Unicode decimal class.
+    return len(text) == 4 and text.isdecimal()
+
+
 def _parse_year_or_date(value):
     if not value:
         return None
@@ -140,7 +217,7 @@ def _parse_year_or_date(value):
         if parsed_year:
             return parsed_year
     text = str(value).strip()
-    if re.fullmatch(r"\d{4}", text):
+    if _is_four_digits(text):
         return _parse_year(text)
     return _parse_date(text)
 
@@ -155,7 +232,7 @@ def _is_year_only_value(value) -> bool:
             return False
         return 1000 <= numeric <= 9999
     text = str(value).strip()
-    return bool(re.fullmatch(r"\d{4}", text))
+    return _is_four_digits(text)
 
 
 def _format_date(value, fmt: str = "%d-%m-%Y") -> str:
@@ -172,22 +249,22 @@ def _format_driving_since(customer: Customer) -> str:
 
 def _clean_status(value):
     value = (value or "").strip().lower()
-    valid_statuses = {choice[0] for choice in Rental.STATUS_CHOICES}
-    if value in valid_statuses:
+    if value in _VALID_STATUSES:
+        return value
+    return _STATUS_LABEL_MAP.get(value, "draft")
+
+
+def _pick_position(values, positions):
+    """Return the first non-empty cell of ``values`` at any of ``positions`` (resolved from the header)."""
+    for position in positions:
+        value = values[position]
+        if value is None:
+            continue
+        if isinstance(value, str):
+            value = value.strip()
+            if not value:
+                continue
         return value
-    label_map = {label.lower(): code for code, label in Rental.STATUS_CHOICES}
-    return label_map.get(value, "draft")
-
-
-def _pick_value(row, keys):
-    """Return the first non-empty value for any matching key in the row."""
-    for key in keys:
-        if key in row:
-            value = row[key]
-            if isinstance(value, str):
-                value = value.strip()
-            if value not in ("", None):
-                return value
     return None
 
 
@@ -208,6 +285,8 @@ def _clean_text_value(value):
 def _limit_length(value: str | None, max_len: int):
     if value is None:
         return None
+    if type(value) is str:
+        return value if len(value) <= max_len else value[:max_len]
     return str(value)[:max_len]
 
 
@@ -221,10 +300,13 @@ def _clean_phone_value(value):
     raw = _clean_text_value(value)
     if not raw:
         return ""
+    if raw.isdigit() and raw.isascii():
+        # Already a bare number (the usual export format): nothing to split or strip.
+        return _limit_length(raw, PHONE_MAX_LEN)
 
-    parts = re.split(r"[;,/\n\r]+", raw)
+    parts = _PHONE_SPLIT_RE.split(raw)
     for part in parts:
-        cleaned = re.sub(r"[^0-9+]", "", part)
+        cleaned = _PHONE_STRIP_RE.sub("", part)
         if cleaned:
             if cleaned[0] != "+" and part.strip().startswith("+"):
                 cleaned = "+" + cleaned
@@ -247,13 +329,46 @@ def _split_tags(raw: str | None) -> list[str]:
         return []
 
     tags = []
-    for piece in re.split(r"[;,#/|\n\r]+", str(raw)):
+    for piece in TAG_SPLIT_RE.split(str(raw)):
         normalized = _clean_tag_name(piece)
         if normalized and normalized not in tags:
             tags.append(normalized)
     return tags
 
 
+@contextmanager
+def _import_transaction():
+    """Run an import in one transaction; PostgreSQL commits it without waiting for the WAL flush.
+
+    A crash right after commit can lose the import, but never leaves it half
+    applied, and imports can simply be re-run.
+    """
+    with transaction.atomic():
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL synchronous_commit TO OFF")
+        yield
+
+
+def _copy_rows(table: str, columns: tuple[str, ...], rows) -> None:
+    """Load rows of plain numbers with COPY FROM STDIN (PostgreSQL only)."""
+    quote = connection.ops.quote_name
+    sql = f"COPY {quote(table)} ({', '.join(quote(column) for column in columns)}) FROM STDIN"
+    with connection.cursor() as cursor:
+        raw_cursor = cursor.cursor
+        if hasattr(raw_cursor, "copy_expert"):  # psycopg2
+            buffer = io.StringIO()
+            for row in rows:
+                buffer.write("\t".join(str(value) for value in row))
+                buffer.write("\n")
+            buffer.seek(0)
+            raw_cursor.copy_expert(sql, buffer)
+        else:  # psycopg 3
+            with raw_cursor.copy(sql) as copy:
+                for row in rows:
+                    copy.write_row(row)
+
+
 def _sync_customer_tags(customers_by_license: dict[str, Customer], tags_by_license: dict[str, list[str] | None]):
     """
     Apply tag lists (by license number) to customer objects efficiently.
@@ -281,14 +396,25 @@ def _sync_customer_tags(customers_by_license: dict[str, Customer], tags_by_licen
         return
 
     existing_tags = {
-        tag.name.lower(): tag for tag in CustomerTag.objects.filter(name__in=tag_names)
+        tag.name.lower(): tag for tag in CustomerTag.objects.filter(name__in=tag_names).only("id", "name")
     }
     missing = [name for name in tag_names if name.lower() not in existing_tags]
     if missing:
-        CustomerTag.objects.bulk_create([CustomerTag(name=name) for name in missing], ignore_conflicts=True)
-        existing_tags.update(
-            {tag.name.lower(): tag for tag in CustomerTag.objects.filter(name__in=tag_names)}
+        # Upserting (instead of ignore_conflicts) makes the backend return ids for
+        # both new rows and rows created concurrently, so no re-select is needed.
+        created = CustomerTag.objects.bulk_create(
+            [CustomerTag(name=name) for name in missing],
+            update_conflicts=True,
+            unique_fields=["name"],
+            update_fields=["name"],
+            batch_size=IMPORT_BATCH_SIZE,
         )
+        if any(tag.pk is None for tag in created):
+            created = CustomerTag.objects.filter(name__in=missing).only("id", "name")
+        for tag in created:
+            existing_tags.setdefault(tag.name.lower(), tag)
+        # bulk_create sends no post_save, so drop the cached filter list here.
+        invalidate_customer_tags()
 
     # Apply tag updates in bulk instead of per-customer `.set()` calls.
     # This avoids tens of thousands of individual queries for large imports.
@@ -300,7 +426,8 @@ def _sync_customer_tags(customers_by_license: dict[str, Customer], tags_by_licen
         tag_ids = []
         for tag_name in tags:
             tag = existing_tags.get(tag_name.lower())
-            if tag:
+            # Names differing only in case resolve to one tag; link it once.
+            if tag and tag.id not in tag_ids:
                 tag_ids.append(tag.id)
         if tag_ids:
             targets[customer.id] = tag_ids
@@ -310,357 +437,505 @@ def _sync_customer_tags(customers_by_license: dict[str, Customer], tags_by_licen
 
     through = Customer.tags.through
     m2m_field = Customer._meta.get_field("tags")
-    src_attname = through._meta.get_field(m2m_field.m2m_field_name()).attname
-    dst_attname = through._meta.get_field(m2m_field.m2m_reverse_field_name()).attname
+    src_field = through._meta.get_field(m2m_field.m2m_field_name())
+    dst_field = through._meta.get_field(m2m_field.m2m_reverse_field_name())
+
+    with _import_transaction():
+        # Only touch the links that actually change, so re-importing an
+        # unchanged file does not rewrite every through row.
+        stale_ids = []
+        linked: set[tuple[int, int]] = set()
+        existing_links = through.objects.filter(**{f"{src_field.attname}__in": list(targets.keys())}).values_list(
+            "pk", src_field.attname, dst_field.attname
+        )
+        for link_id, customer_id, tag_id in existing_links:
+            if tag_id in targets[customer_id]:
+                linked.add((customer_id, tag_id))
+            else:
+                stale_ids.append(link_id)
 
-    with transaction.atomic():
-        through.objects.filter(**{f"{src_attname}__in": list(targets.keys())}).delete()
+        if stale_ids:
+            through.objects.filter(pk__in=stale_ids).delete()
+
+        pairs = [
+            (customer_id, tag_id)
+            for customer_id, tag_ids in targets.items()
+            for tag_id in tag_ids
+            if (customer_id, tag_id) not in linked
+        ]
+        if not pairs:
+            return
+
+        if connection.vendor == "postgresql":
+            _copy_rows(through._meta.db_table, (src_field.column, dst_field.column), pairs)
+            return
 
         batch: list = []
-        for customer_id, tag_ids in targets.items():
-            for tag_id in tag_ids:
-                batch.append(through(**{src_attname: customer_id, dst_attname: tag_id}))
-                if len(batch) >= IMPORT_BATCH_SIZE:
-                    through.objects.bulk_create(batch, batch_size=IMPORT_BATCH_SIZE)
-                    batch.clear()
+        for customer_id, tag_id in pairs:
+            batch.append(through(**{src_field.attname: customer_id, dst_field.attname: tag_id}))
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                through.objects.bulk_create(batch, batch_size=IMPORT_BATCH_SIZE)
+                batch.clear()
 
         if batch:
             through.objects.bulk_create(batch, batch_size=IMPORT_BATCH_SIZE)
 
 
-def _serialize_car_pricing(car: Car):
-    """Prepare car pricing info for the rental form JS helper."""
+_CAR_PRICING_RATE_FIELDS = (
+    "daily_rate",
+    "rate_1_4_high",
+    "rate_5_14_high",
+    "rate_15_plus_high",
+    "rate_1_4_low",
+    "rate_5_14_low",
+    "rate_15_plus_low",
+)
 
-    def _num(value):
-        return float(value) if value is not None else 0
 
-    return {
-        "id": car.id,
-        "label": str(car),
-        "plate_number": car.plate_number,
-        "region_code": car.region_code or "",
-        "daily_rate": _num(car.daily_rate),
-        "rate_1_4_high": _num(car.rate_1_4_high),
-        "rate_5_14_high": _num(car.rate_5_14_high),
-        "rate_15_plus_high": _num(car.rate_15_plus_high),
-        "rate_1_4_low": _num(car.rate_1_4_low),
-        "rate_5_14_low": _num(car.rate_5_14_low),
-        "rate_15_plus_low": _num(car.rate_15_plus_low),
-        "make": car.make,
-        "model": car.model,
-        "year": car.year,
-        "vin": car.vin or "",
-        "sts_number": car.sts_number or "",
-        "sts_issue_date": car.sts_issue_date.strftime("%d-%m-%Y") if car.sts_issue_date else "",
-        "sts_issued_by": car.sts_issued_by or "",
-        "edit_url": reverse("rentals:car_update", args=[car.pk]),
-    }
+def _car_pricing_payload():
+    """Prepare car pricing info for the rental form JS helper (cached briefly; dropped when a car changes)."""
+
+    def _build():
+        payload = []
+        values = Car.objects.order_by("pk").values(
+            "id",
+            "plate_number",
+            "make",
+            "model",
+            "year",
+            "region_code",
+            "vin",
+            "sts_number",
+            "sts_issue_date",
+            "sts_issued_by",
+            *_CAR_PRICING_RATE_FIELDS,
+        )
+        for car in values:
+            payload.append(
+                {
+                    "id": car["id"],
+                    "label": car_label(car["plate_number"], car["make"], car["model"], car["year"]),
+                    "plate_number": car["plate_number"],
+                    "region_code": car["region_code"] or "",
+                    **{
+                        field: float(car[field]) if car[field] is not None else 0
+                        for field in _CAR_PRICING_RATE_FIELDS
+                    },
+                    "make": car["make"],
+                    "model": car["model"],
+                    "year": car["year"],
+                    "vin": car["vin"] or "",
+                    "sts_number": car["sts_number"] or "",
+                    "sts_issue_date": car["sts_issue_date"].strftime("%d-%m-%Y") if car["sts_issue_date"] else "",
+                    "sts_issued_by": car["sts_issued_by"] or "",
+                    "edit_url": reverse("rentals:car_update", args=[car["id"]]),
+                }
+            )
+        return payload
+
+    return cache.get_or_set(CAR_PRICING_CACHE_KEY, _build, LOOKUP_CACHE_TIMEOUT)
+
+
+def _contract_template_choices():
+    """Template ids and names for the contract menus (cached briefly; dropped when a template changes)."""
+    return cache.get_or_set(
+        CONTRACT_TEMPLATES_CACHE_KEY,
+        lambda: list(ContractTemplate.objects.order_by("pk").values("pk", "name")),
+        LOOKUP_CACHE_TIMEOUT,
+    )
+
+
+def _customer_tag_choices():
+    """Tag ids and names for the customer list filter (cached briefly; dropped when a tag changes)."""
+    return cache.get_or_set(
+        CUSTOMER_TAGS_CACHE_KEY,
+        lambda: list(CustomerTag.objects.order_by("name").values("id", "name")),
+        LOOKUP_CACHE_TIMEOUT,
+    )
+
+
+def _detect_csv_encoding(raw_file, chunk_size: int = 1 << 16) -> str:
+    """Return utf-8-sig if the file has a UTF-8 BOM or is valid UTF-8, otherwise cp1251."""
+    raw_file.seek(0)
+    if raw_file.read(len(codecs.BOM_UTF8)) == codecs.BOM_UTF8:
+        # Excel's "CSV UTF-8" always writes a BOM, so skip validating the whole file.
+        raw_file.seek(0)
+        return "utf-8-sig"
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    raw_file.seek(0)
+    try:
+        while chunk := raw_file.read(chunk_size):
+            decoder.decode(chunk)
+        decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        return "cp1251"
+    finally:
+        raw_file.seek(0)
+    return "utf-8-sig"
+
+
+def _read_csv_values(upload):
+    """Yield the CSV header, then each non-empty row as a list at least as wide as it."""
+    raw_file = getattr(upload, "file", upload)
+    encoding = _detect_csv_encoding(raw_file)
+    # A BOM file is not validated up front; replace stray bytes rather than fail mid-import.
+    errors = "replace" if encoding == "utf-8-sig" else "strict"
+    text = io.TextIOWrapper(raw_file, encoding=encoding, errors=errors, newline="")
+    try:
+        reader = csv.reader(text)
+        header = next(reader, None)
+        if header is None:
+            return
+        yield header
+        width = len(header)
+        for values in reader:
+            if not values:
+                continue
+            if len(values) < width:
+                # Pad short rows like DictReader does, so every row shares the header.
+                values += [None] * (width - len(values))
+            yield values
+    finally:
+        # Detach so closing the wrapper does not close the underlying upload.
+        text.detach()
 
 
 def _read_csv_rows(upload):
-    raw = upload.read()
-    decoded_text = None
-    for encoding in ("utf-8-sig", "cp1251"):
-        try:
-            decoded_text = raw.decode(encoding)
-            break
-        except UnicodeDecodeError as exc:
-            continue
+    """Yield CSV rows as dicts, decoding the upload incrementally."""
+    rows = _read_csv_values(upload)
+    header = next(rows, None)
+    if header is None:
+        return
+    # csv.reader plus zip avoids DictReader's per-row Python-level bookkeeping.
+    for values in rows:
+        yield dict(zip(header, values))
 
-    if decoded_text is None:
-        raise UnicodeDecodeError(
-            "utf-8",
-            raw,
-            0,
-            0,
-            "Не удалось декодировать файл с разделителями. Проверьте кодировку.",
-        )
 
-    return list(csv.DictReader(decoded_text.splitlines()))
+def _kept_columns(header, columns):
+    """Return ``(index, name)`` pairs of the header columns a reader should yield.
+
+    ``columns`` holds folded header names (see ``_fold_header``).
+    """
+    return [
+        (idx, name) for idx, name in enumerate(header) if columns is None or _fold_header(name) in columns
+    ]
 
 
-def _read_excel_rows(upload):
+def _read_excel_rows(upload, columns=None):
     if xlrd is None:
         raise ImportError("Чтение таблиц Эксель в старом формате недоступно.")
 
     book = xlrd.open_workbook(file_contents=upload.read())
     sheet = book.sheet_by_index(0)
     if sheet.nrows == 0:
-        return []
+        return
 
-    headers = [str(sheet.cell_value(0, col)).strip() for col in range(sheet.ncols)]
-    rows = []
+    kept = _kept_columns([str(value).strip() for value in sheet.row_values(0)], columns)
+    # Rows are padded to ncols (ragged_rows is off), so every header index exists.
     for row_idx in range(1, sheet.nrows):
-        data = {}
-        for col_idx, header in enumerate(headers):
-            value = sheet.cell_value(row_idx, col_idx) if col_idx < sheet.ncols else ""
-            if isinstance(value, float) and value.is_integer():
-                value = int(value)
-            data[header] = value
-        rows.append(data)
-    return rows
+        values = sheet.row_values(row_idx)
+        yield {
+            name: int(value) if isinstance(value, float) and value.is_integer() else value
+            for name, value in ((name, values[idx]) for idx, name in kept)
+        }
 
 
-def _read_xlsx_rows(upload):
+def _read_xlsx_rows(upload, columns=None):
     if openpyxl is None:
         raise ImportError("Чтение таблиц Эксель в новом формате недоступно.")
 
     upload.seek(0)
     wb = openpyxl.load_workbook(upload, read_only=True, data_only=True)
-    ws = wb.active
-    rows = []
-    header = []
-    for idx, row in enumerate(ws.iter_rows(values_only=True)):
-        if idx == 0:
-            header = [str(cell).strip() if cell is not None else "" for cell in row]
-            continue
+    try:
+        row_iter = wb.active.iter_rows(values_only=True)
+        first_row = next(row_iter, None)
+        header = [str(cell).strip() if cell is not None else "" for cell in first_row or ()]
         if not header:
-            break
-        data = {}
-        for col_idx, header_name in enumerate(header):
-            value = row[col_idx] if col_idx < len(row) else ""
-            if isinstance(value, float) and value.is_integer():
-                value = int(value)
-            data[header_name] = value
-        rows.append(data)
-    return rows
-
-
-def _load_rows(upload):
+            return
+
+        kept = _kept_columns(header, columns)
+        width = len(header)
+        padding = ("",) * width
+        for row in row_iter:
+            if len(row) < width:
+                row = (*row, *padding[len(row):])
+            yield {
+                name: int(value) if isinstance(value, float) and value.is_integer() else value
+                for name, value in ((name, row[idx]) for idx, name in kept)
+            }
+    finally:
+        # Read-only workbooks keep the source file open until closed explicitly.
+        wb.close()
+
+
+def _load_rows(upload, columns=None):
+    """Return an iterator of row dicts; rows are read lazily as it is consumed.
+
+    ``columns`` optionally limits Excel rows to the named headers, which saves
+    building dict entries for the unused columns of wide spreadsheets.
+    """
     filename = (upload.name or "").lower()
     if filename.endswith(".xlsx"):
-        return _read_xlsx_rows(upload)
+        return _read_xlsx_rows(upload, columns)
     if filename.endswith(".xls"):
-        return _read_excel_rows(upload)
+        return _read_excel_rows(upload, columns)
     return _read_csv_rows(upload)
 
 
+class ImportReadError(Exception):
+    """An upload could not be read past its first row (bad bytes, corrupt sheet)."""
+
+
+def _guard_row_reads(rows):
+    """Yield from ``rows``, re-raising reader errors as ImportReadError.
+
+    Rows are read lazily while the import writes them, so this lets the views
+    tell a broken file apart from a failing write.
+    """
+    while True:
+        try:
+            row = next(rows)
+        except StopIteration:
+            return
+        except Exception as exc:  # noqa: BLE001 - any reader failure means a broken file
+            raise ImportReadError(str(exc)) from exc
+        yield row
+
+
+def _open_rows(upload, columns=None):
+    """Start reading an upload; return None when it has no data rows.
+
+    The first row is read eagerly so empty files and format errors surface here.
+    Errors in later rows are raised as ImportReadError while the rows are consumed.
+    """
+    rows = _load_rows(upload, columns)
+    first_row = next(rows, None)
+    if first_row is None:
+        return None
+    return chain((first_row,), _guard_row_reads(rows))
+
+
+@lru_cache(maxsize=4096)
+def _fold_header(name) -> str:
+    """Fold a column header for case- and ё-insensitive alias matching."""
+    return str(name).strip().lower().replace("ё", "е")
+
+
+@lru_cache(maxsize=32)
+def _fold_columns(header: tuple) -> dict[str, str]:
+    """Map folded header names to the file's own columns; the first column wins."""
+    columns: dict[str, str] = {}
+    for column in header:
+        columns.setdefault(_fold_header(column), column)
+    return columns
+
+
+# Header aliases accepted by the car importer, in lookup priority order.
+# Headers are matched after _fold_header, so case and ё/е variants are implied.
+_CAR_PLATE_KEYS = (
+    "plate_number",
+    "Plate number",
+    "Регистрационный знак",
+    "Гос.номера",
+    "Госномер",
+    "Гос. номер",
+    "Государственный номер",
+)
+_CAR_MAKE_KEYS = ("make", "Марка")
+_CAR_MODEL_KEYS = ("model", "Модель")
+_CAR_NAME_KEYS = ("Название",)
+_CAR_YEAR_KEYS = ("year", "Год выпуска", "Год")
+_CAR_VIN_KEYS = ("vin", "vin_code", "ВИН")
+_CAR_COLOR_KEYS = ("color", "Цвет")
+_CAR_REGION_CODE_KEYS = ("region_code", "Регион", "Регион (26 или 82)")
+_CAR_PHOTO_URL_KEYS = ("photo_url", "Фото", "Фото (ссылка)", "Фото ссылка")
+_CAR_STS_NUMBER_KEYS = ("sts_number", "СТС", "Свидетельство", "СТС номер", "Номер СТС")
+_CAR_STS_ISSUE_DATE_KEYS = ("sts_issue_date", "Дата выдачи СТС", "СТС выдано")
+_CAR_STS_ISSUED_BY_KEYS = ("sts_issued_by", "Кем выдано СТС", "Кем выдано", "Кем выдана СТС")
+_CAR_REGISTRATION_CERTIFICATE_INFO_KEYS = ("registration_certificate_info", "Свидетельство о регистрации")
+_CAR_FUEL_TANK_VOLUME_KEYS = ("fuel_tank_volume_liters", "Объем бака", "Объем бака (л)", "Объем бака, л")
+_CAR_FUEL_TANK_COST_KEYS = (
+    "fuel_tank_cost_rub",
+    "Объем бака(руб.)",
+    "Объем бака (руб.)",
+    "Объем бака (руб)",
+    "Стоимость полного бака, ₽",
+)
+_CAR_SECURITY_DEPOSIT_KEYS = ("security_deposit", "Залог")
+_CAR_RATE_1_4_HIGH_KEYS = ("rate_1_4_high", "1-4 дней(вс)", "1-4 дней (вс)", "1-4 дня(вс)", "1-4 дня (вс)")
+_CAR_RATE_5_14_HIGH_KEYS = ("rate_5_14_high", "5-14 дней(вс)", "5-14 дней (вс)", "5-14 дня (вс)")
+_CAR_RATE_15_HIGH_KEYS = ("rate_15_plus_high", "15 дней и более(вс)", "15 дней и более (вс)", "15+ дней (вс)")
+_CAR_RATE_1_4_LOW_KEYS = ("rate_1_4_low", "1-4 дней(нс)", "1-4 дней (нс)", "1-4 дня (нс)")
+_CAR_RATE_5_14_LOW_KEYS = ("rate_5_14_low", "5-14 дней(нс)", "5-14 дней (нс)", "5-14 дня (нс)")
+_CAR_RATE_15_LOW_KEYS = ("rate_15_plus_low", "15 дней и более(нс)", "15 дней и более (нс)", "15+ дней (нс)")
+_CAR_DAILY_RATE_KEYS = ("daily_rate", "Daily rate", "Базовый тариф", "Суточный тариф")
+_CAR_IS_ACTIVE_KEYS = ("is_active", "active", "Активен", "Активный")
+
+
+def _loss_fee_header_candidates(field_name: str, label: str) -> list[str]:
+    # Support the optional "Стоимость при утере ..." prefix used by some templates;
+    # case and ё/е differences are handled by _fold_header.
+    candidates = [field_name, label]
+    for prefix in ("Стоимость при утере ", "Стоимости при утере "):
+        candidates.append(prefix + label)
+
+    # Backward-compatible aliases for known one-off templates.
+    if field_name == "loss_gps_fee":
+        candidates.append("GPS")
+        # Some spreadsheets include "Автобокс с креплением" instead of "Навигатор".
+        candidates.append("Автобокс с креплением")
+
+    return candidates
+
+
+_CAR_LOSS_FEE_KEYS = {
+    field: tuple(_loss_fee_header_candidates(field, label)) for field, label in CAR_LOSS_FEE_FIELDS
+}
+
+
+_CAR_HEADER_ALIASES = {
+    "plate": _CAR_PLATE_KEYS,
+    "make": _CAR_MAKE_KEYS,
+    "model": _CAR_MODEL_KEYS,
+    "name": _CAR_NAME_KEYS,
+    "year": _CAR_YEAR_KEYS,
+    "vin": _CAR_VIN_KEYS,
+    "color": _CAR_COLOR_KEYS,
+    "region_code": _CAR_REGION_CODE_KEYS,
+    "photo_url": _CAR_PHOTO_URL_KEYS,
+    "sts_number": _CAR_STS_NUMBER_KEYS,
+    "sts_issue_date": _CAR_STS_ISSUE_DATE_KEYS,
+    "sts_issued_by": _CAR_STS_ISSUED_BY_KEYS,
+    "registration_certificate_info": _CAR_REGISTRATION_CERTIFICATE_INFO_KEYS,
+    "fuel_tank_volume": _CAR_FUEL_TANK_VOLUME_KEYS,
+    "fuel_tank_cost": _CAR_FUEL_TANK_COST_KEYS,
+    "security_deposit": _CAR_SECURITY_DEPOSIT_KEYS,
+    "rate_1_4_high": _CAR_RATE_1_4_HIGH_KEYS,
+    "rate_5_14_high": _CAR_RATE_5_14_HIGH_KEYS,
+    "rate_15_high": _CAR_RATE_15_HIGH_KEYS,
+    "rate_1_4_low": _CAR_RATE_1_4_LOW_KEYS,
+    "rate_5_14_low": _CAR_RATE_5_14_LOW_KEYS,
+    "rate_15_low": _CAR_RATE_15_LOW_KEYS,
+    "daily_rate": _CAR_DAILY_RATE_KEYS,
+    "is_active": _CAR_IS_ACTIVE_KEYS,
+    **_CAR_LOSS_FEE_KEYS,
+}
+
+
+def _build_car_alias_index() -> dict[str, tuple[str, int]]:
+    """Map every folded header spelling to its field and priority among the field's aliases."""
+    index: dict[str, tuple[str, int]] = {}
+    for field, aliases in _CAR_HEADER_ALIASES.items():
+        for priority, alias in enumerate(aliases):
+            index.setdefault(_fold_header(alias), (field, priority))
+    return index
+
+
+_CAR_ALIAS_INDEX = _build_car_alias_index()
+# Folded header spelling -> field name, built once at import time.
+_CAR_FIELD_ALIASES: dict[str, str] = {alias: field for alias, (field, _) in _CAR_ALIAS_INDEX.items()}
+
+
+@lru_cache(maxsize=32)
+def _resolve_car_headers(header: tuple) -> tuple[tuple[str, str], ...]:
+    """Return the ``(column, field)`` pairs of a file header that map to car fields.
+
+    All rows of an upload share one header, so this runs once per file.
+    Pairs are ordered by alias priority, so a file that repeats a field
+    under two spellings still prefers the same column as before.
+    """
+    matched = [(column, _CAR_ALIAS_INDEX.get(_fold_header(column))) for column in header]
+    matched = sorted((pair for pair in matched if pair[1] is not None), key=lambda pair: pair[1][1])
+    return tuple((column, field) for column, (field, _) in matched)
+
+
+def _pick_car_values(row) -> dict:
+    """Map a raw row onto car field names in one pass over its matching columns."""
+    values = {}
+    for column, field in _resolve_car_headers(tuple(row)):
+        if field in values:
+            continue
+        value = row[column]
+        if value is None:
+            continue
+        if isinstance(value, str):
+            value = value.strip()
+            if not value:
+                continue
+        values[field] = value
+    return values
+
+
 def _normalize_car_row(row):
     """
     Normalize a raw row (CSV or XLS) into car fields we support.
     Designed to work with the provided Russian-language XLS export.
+    Returns None when plate, make, model or year is missing.
     """
-    plate = _pick_value(
-        row,
-        [
-            "plate_number",
-            "Plate number",
-            "регистрационный знак",
-            "Регистрационный знак",
-            "гос.номера",
-            "Гос.номера",
-            "Госномер",
-            "Гос. номер",
-            "Государственный номер",
-        ],
-    )
+    values = _pick_car_values(row)
+    plate = values.get("plate")
     if plate:
-        plate = str(plate).strip().replace(" ", "").upper()
+        plate = _WHITESPACE_RE.sub("", str(plate)).upper()
 
-    make = _pick_value(row, ["make", "Марка", "марка"])
-    model = _pick_value(row, ["model", "Модель", "модель"])
-    name_field = _pick_value(row, ["Название", "название"])
+    make = values.get("make")
+    model = values.get("model")
+    name_field = values.get("name")
 
     if make and not model:
-        parts = str(make).strip().split(" ", 1)
+        parts = _WHITESPACE_RE.split(str(make).strip(), maxsplit=1)
         if len(parts) == 2:
             make, model = parts
 
     if not make and name_field:
         text = str(name_field).strip()
-        parts = text.split(" ", 1)
+        parts = _WHITESPACE_RE.split(text, maxsplit=1)
         make = parts[0]
         model = parts[1] if len(parts) == 2 else ""
     elif name_field and not model:
         text = str(name_field).strip()
-        parts = text.split(" ", 1)
+        parts = _WHITESPACE_RE.split(text, maxsplit=1)
         if len(parts) == 2:
             model = parts[1]
 
-    year_val = _pick_value(row, ["year", "Year", "год выпуска", "Год выпуска", "Год"])
-    try:
-        year = int(float(year_val))
-    except (TypeError, ValueError):
-        year = None
-
-    vin = _pick_value(row, ["vin", "VIN", "vin_code", "Vin", "ВИН", "Вин"])
-    color = _pick_value(row, ["color", "Color", "Цвет", "цвет"])
-    region_code = _pick_value(row, ["region_code", "Регион", "регион", "Регион (26 или 82)"])
-    photo_url = _pick_value(row, ["photo_url", "Фото", "Фото (ссылка)", "Фото ссылка"])
-    sts_number = _pick_value(
-        row,
-        [
-            "sts_number",
-            "СТС",
-            "Свидетельство",
-            "СТС номер",
-            "номер СТС",
-            "Номер СТС",
-        ],
-    )
-    sts_issue_date_raw = _pick_value(
-        row,
-        [
-            "sts_issue_date",
-            "дата выдачи стс",
-            "СТС выдано",
-            "Дата выдачи СТС",
-        ],
-    )
-    sts_issued_by = _pick_value(
-        row,
-        [
-            "sts_issued_by",
-            "кем выдано стс",
-            "кем выдано",
-            "Кем выдана СТС",
-        ],
-    )
-    registration_certificate_info = _pick_value(
-        row,
-        ["registration_certificate_info", "Свидетельство о регистрации", "свидетельство о регистрации"],
-    )
-    fuel_tank_volume_raw = _pick_value(
-        row,
-        [
-            "fuel_tank_volume_liters",
-            "Объем бака",
-            "Объём бака",
-            "объем бака",
-            "объём бака",
-            "Объем бака (л)",
-            "Объём бака (л)",
-            "объем бака (л)",
-            "объём бака (л)",
-            "Объем бака, л",
-            "Объём бака, л",
-        ],
-    )
-    fuel_tank_cost_raw = _pick_value(
-        row,
-        [
-            "fuel_tank_cost_rub",
-            "Объем бака(руб.)",
-            "Объём бака(руб.)",
-            "Объем бака (руб.)",
-            "Объём бака (руб.)",
-            "объем бака (руб.)",
-            "объём бака (руб.)",
-            "Объем бака (руб)",
-            "Объём бака (руб)",
-            "объем бака (руб)",
-            "объём бака (руб)",
-            "Стоимость полного бака, ₽",
-        ],
-    )
-    security_deposit_raw = _pick_value(row, ["security_deposit", "Залог", "залог"])
-
-    rate_1_4_high = _pick_value(
-        row, ["rate_1_4_high", "1-4 дней(вс)", "1-4 дней (вс)", "1-4 дня(вс)", "1-4 дня (вс)"]
-    )
-    rate_5_14_high = _pick_value(
-        row, ["rate_5_14_high", "5-14 дней(вс)", "5-14 дней (вс)", "5-14 дня (вс)"]
-    )
-    rate_15_high = _pick_value(
-        row,
-        [
-            "rate_15_plus_high",
-            "15 дней и более(вс)",
-            "15 дней и более (вс)",
-            "15+ дней (вс)",
-        ],
-    )
+    year = _parse_int(values.get("year"))
 
-    rate_1_4_low = _pick_value(
-        row, ["rate_1_4_low", "1-4 дней(нс)", "1-4 дней (нс)", "1-4 дня (нс)"]
-    )
-    rate_5_14_low = _pick_value(
-        row, ["rate_5_14_low", "5-14 дней(нс)", "5-14 дней (нс)", "5-14 дня (нс)"]
-    )
-    rate_15_low = _pick_value(
-        row,
-        [
-            "rate_15_plus_low",
-            "15 дней и более(нс)",
-            "15 дней и более (нс)",
-            "15+ дней (нс)",
-        ],
-    )
+    # Every caller skips such rows, so avoid parsing rates and dates for them.
+    if not plate or not make or not model or not year:
+        return None
 
-    rate_raw = _pick_value(row, ["daily_rate", "Daily rate", "Базовый тариф", "Суточный тариф"])
-    active_raw = _pick_value(row, ["is_active", "active", "активен", "активный", "Активен"])
+    vin = values.get("vin")
+    color = values.get("color")
+    region_code = values.get("region_code")
+    photo_url = values.get("photo_url")
+    sts_number = values.get("sts_number")
+    sts_issue_date_raw = values.get("sts_issue_date")
+    sts_issued_by = values.get("sts_issued_by")
+    registration_certificate_info = values.get("registration_certificate_info")
+    fuel_tank_volume_raw = values.get("fuel_tank_volume")
+    fuel_tank_cost_raw = values.get("fuel_tank_cost")
+    security_deposit_raw = values.get("security_deposit")
+
+    rate_1_4_high = values.get("rate_1_4_high")
+    rate_5_14_high = values.get("rate_5_14_high")
+    rate_15_high = values.get("rate_15_high")
+
+    rate_1_4_low = values.get("rate_1_4_low")
+    rate_5_14_low = values.get("rate_5_14_low")
+    rate_15_low = values.get("rate_15_low")
+
+    rate_raw = values.get("daily_rate")
+    active_raw = values.get("is_active")
     is_active = _parse_bool(active_raw) if active_raw not in (None, "") else True
 
-    daily_rate = _parse_decimal(rate_raw) if rate_raw not in (None, "") else None
-    rate_1_4_high = _parse_decimal(rate_1_4_high) if rate_1_4_high not in (None, "") else None
-    rate_5_14_high = _parse_decimal(rate_5_14_high) if rate_5_14_high not in (None, "") else None
-    rate_15_high = _parse_decimal(rate_15_high) if rate_15_high not in (None, "") else None
-    rate_1_4_low = _parse_decimal(rate_1_4_low) if rate_1_4_low not in (None, "") else None
-    rate_5_14_low = _parse_decimal(rate_5_14_low) if rate_5_14_low not in (None, "") else None
-    rate_15_low = _parse_decimal(rate_15_low) if rate_15_low not in (None, "") else None
-
-    def _header_candidates(field_name: str, label: str) -> list[str]:
-        # Support common header variants from different templates:
-        # - case differences ("Гос. Номера" vs "Гос. номера")
-        # - optional prefix ("Стоимость при утере ...")
-        candidates: list[str] = []
-
-        def _add(value: str | None):
-            if not value:
-                return
-            if value not in candidates:
-                candidates.append(value)
-
-        _add(field_name)
-        _add(label)
-
-        if not isinstance(label, str):
-            return candidates
-
-        normalized = label.replace("ё", "е").replace("Ё", "Е")
-        _add(normalized)
-        _add(label.lower())
-        if normalized != label:
-            _add(normalized.lower())
-
-        # A few spreadsheets title-case words after dots/abbreviations.
-        _add(label.title())
-        if normalized != label:
-            _add(normalized.title())
-
-        for prefix in (
-            "Стоимость при утере ",
-            "стоимость при утере ",
-            "Стоимости при утере ",
-            "стоимости при утере ",
-        ):
-            _add(prefix + label)
-            _add(prefix + normalized)
-            _add(prefix + label.lower())
-            _add(prefix + normalized.lower())
-            _add(prefix + label.title())
-            if normalized != label:
-                _add(prefix + normalized.title())
-
-        # Backward-compatible aliases for known one-off templates.
-        if field_name == "loss_gps_fee":
-            _add("GPS")
-            _add("gps")
-            # Some spreadsheets include "Автобокс с креплением" instead of "Навигатор".
-            _add("Автобокс с креплением")
-
-        return candidates
-
-    loss_fee_values = {}
-    for field, label in CAR_LOSS_FEE_FIELDS:
-        loss_raw = _pick_value(row, _header_candidates(field, label))
-        loss_fee_values[field] = _parse_decimal(loss_raw) if loss_raw not in (None, "") else None
-
-    def _first_rate(*values):
-        for value in values:
-            if value not in (None, Decimal("0")):
-                return value
-        return None
+    daily_rate = _parse_decimal_or_none(rate_raw)
+    rate_1_4_high = _parse_decimal_or_none(rate_1_4_high)
+    rate_5_14_high = _parse_decimal_or_none(rate_5_14_high)
+    rate_15_high = _parse_decimal_or_none(rate_15_high)
+    rate_1_4_low = _parse_decimal_or_none(rate_1_4_low)
+    rate_5_14_low = _parse_decimal_or_none(rate_5_14_low)
+    rate_15_low = _parse_decimal_or_none(rate_15_low)
+
+    loss_fee_values = {field: _parse_decimal_or_none(values.get(field)) for field in _CAR_LOSS_FEE_KEYS}
 
     base_rate = _first_rate(
         daily_rate,
@@ -679,10 +954,8 @@ def _normalize_car_row(row):
     sts_number_clean = _clean_text_value(sts_number)
 
     fuel_tank_volume = _parse_int(fuel_tank_volume_raw) if fuel_tank_volume_raw not in (None, "") else None
-    fuel_tank_cost = _parse_decimal(fuel_tank_cost_raw) if fuel_tank_cost_raw not in (None, "") else None
-    security_deposit = (
-        _parse_decimal(security_deposit_raw) if security_deposit_raw not in (None, "") else None
-    )
+    fuel_tank_cost = _parse_decimal_or_none(fuel_tank_cost_raw)
+    security_deposit = _parse_decimal_or_none(security_deposit_raw)
 
     return {
         "plate_number": plate or "",
@@ -712,6 +985,178 @@ def _normalize_car_row(row):
     }
 
 
+CAR_IMPORT_BATCH_SIZE = 1000
+# Columns written by the car importer; plate_number is the conflict target.
+CAR_IMPORT_FIELDS = [
+    "make",
+    "model",
+    "year",
+    "vin",
+    "color",
+    "region_code",
+    "photo_url",
+    "sts_number",
+    "sts_issue_date",
+    "sts_issued_by",
+    "registration_certificate_info",
+    "fuel_tank_volume_liters",
+    "fuel_tank_cost_rub",
+    "security_deposit",
+    "daily_rate",
+    "rate_1_4_high",
+    "rate_5_14_high",
+    "rate_15_plus_high",
+    "rate_1_4_low",
+    "rate_5_14_low",
+    "rate_15_plus_low",
+    "is_active",
+    *CAR_LOSS_FEE_NAMES,
+]
+
+# _normalize_car_row output keys read by _car_import_payload, fetched with
+# itemgetter instead of one subscript per field. Rate keys keep the row's short
+# names and map positionally onto the Car fields.
+_get_car_identity = itemgetter("plate_number", "make", "model", "year", "is_active")
+_CAR_RATE_FIELDS = (
+    "rate_1_4_high",
+    "rate_5_14_high",
+    "rate_15_plus_high",
+    "rate_1_4_low",
+    "rate_5_14_low",
+    "rate_15_plus_low",
+)
+_get_car_rates = itemgetter(
+    "rate_1_4_high", "rate_5_14_high", "rate_15_high", "rate_1_4_low", "rate_5_14_low", "rate_15_low"
+)
+_CAR_OPTIONAL_TEXT_FIELDS = (
+    "vin",
+    "color",
+    "region_code",
+    "photo_url",
+    "sts_number",
+    "sts_issued_by",
+    "registration_certificate_info",
+)
+_get_car_optional_text = itemgetter(*_CAR_OPTIONAL_TEXT_FIELDS)
+_CAR_OPTIONAL_VALUE_FIELDS = (
+    "sts_issue_date",
+    "fuel_tank_volume_liters",
+    "fuel_tank_cost_rub",
+    "security_deposit",
+    *CAR_LOSS_FEE_NAMES,
+)
+_get_car_optional_values = itemgetter(*_CAR_OPTIONAL_VALUE_FIELDS)
+
+
+def _car_import_payload(normalized: dict):
+    """Return (plate, values for a new car, values to apply to an existing car).
+
+    Returns None for rows that failed normalization or have no rate at all.
+    Update values leave out empty cells so re-imports never clear fields.
+    """
+    if normalized is None:
+        return None
+    daily_rate = normalized["daily_rate"]
+    # _normalize_car_row falls back through every tariff column, so a missing
+    # daily rate means the row has no usable rate at all.
+    if daily_rate is None:
+        return None
+
+    plate, make, model, year, is_active = _get_car_identity(normalized)
+    rates = dict(zip(_CAR_RATE_FIELDS, _get_car_rates(normalized)))
+    optional_text = dict(zip(_CAR_OPTIONAL_TEXT_FIELDS, _get_car_optional_text(normalized)))
+    optional_values = dict(zip(_CAR_OPTIONAL_VALUE_FIELDS, _get_car_optional_values(normalized)))
+
+    defaults = {
+        "make": make,
+        "model": model,
+        "year": year,
+        **{field: value or None for field, value in optional_text.items()},
+        **optional_values,
+        "daily_rate": daily_rate,
+        **{field: value or _DEC_ZERO for field, value in rates.items()},
+        "is_active": is_active,
+    }
+    updates = {
+        "make": make,
+        "model": model,
+        "year": year,
+        **{field: value for field, value in optional_text.items() if value},
+        **{field: value for field, value in optional_values.items() if value is not None},
+        "daily_rate": daily_rate,
+        **{field: value for field, value in rates.items() if value is not None},
+        "is_active": is_active,
+    }
+    return plate, defaults, updates
+
+
+def _upsert_cars(parsed: list[tuple[str, dict, dict]]) -> None:
+    """Create or update cars from _car_import_payload results in one bulk upsert."""
+    if not parsed:
+        return
+    existing = Car.objects.in_bulk({plate for plate, _, _ in parsed}, field_name="plate_number")
+    pending: dict[str, dict] = {}
+    current: dict[str, dict] = {}
+    for plate, defaults, updates in parsed:
+        if plate in pending:
+            pending[plate].update(updates)
+        elif plate in existing:
+            car = existing[plate]
+            current[plate] = {field: getattr(car, field) for field in CAR_IMPORT_FIELDS}
+            pending[plate] = {**current[plate], **updates}
+        else:
+            pending[plate] = defaults
+
+    # The saved values are already loaded, so re-imports of unchanged cars write nothing.
+    changed = [(plate, values) for plate, values in pending.items() if values != current.get(plate)]
+    if not changed:
+        return
+    # Only rewrite the columns some existing car in this chunk actually changes.
+    dirty = {
+        field
+        for plate, values in changed
+        if plate in current
+        for field, value in values.items()
+        if current[plate][field] != value
+    }
+    update_fields = [field for field in CAR_IMPORT_FIELDS if field in dirty] or CAR_IMPORT_FIELDS
+    Car.objects.bulk_create(
+        # bulk_create bypasses Car.save, so fill the search column here.
+        [
+            Car(plate_number=plate, plate_normalized=normalize_plate(plate), **values)
+            for plate, values in changed
+        ],
+        update_conflicts=True,
+        unique_fields=["plate_number"],
+        update_fields=update_fields,
+        batch_size=CAR_IMPORT_BATCH_SIZE,
+    )
+
+
+# Fields the rental importer writes onto rentals that already exist.
+RENTAL_IMPORT_UPDATE_FIELDS = ("daily_rate", "total_price", "status", "contract_number")
+
+# Header aliases accepted by the rental importer.
+_RENTAL_PLATE_KEYS = ("car_plate_number", "plate_number", "Госномер", "Гос. номер", "Регистрационный знак")
+_RENTAL_LICENSE_KEYS = ("customer_license_number", "license_number", "Номер ВУ", "Водительское удостоверение")
+_RENTAL_START_DATE_KEYS = ("start_date", "Дата начала")
+_RENTAL_END_DATE_KEYS = ("end_date", "Дата окончания")
+_RENTAL_DAILY_RATE_KEYS = ("daily_rate", "Суточный тариф", "Базовый тариф")
+_RENTAL_TOTAL_PRICE_KEYS = ("total_price", "Итоговая сумма")
+_RENTAL_CONTRACT_NUMBER_KEYS = ("contract_number", "Номер договора")
+_RENTAL_STATUS_KEYS = ("status", "Статус")
+_RENTAL_KEY_GROUPS = (
+    _RENTAL_PLATE_KEYS,
+    _RENTAL_LICENSE_KEYS,
+    _RENTAL_START_DATE_KEYS,
+    _RENTAL_END_DATE_KEYS,
+    _RENTAL_DAILY_RATE_KEYS,
+    _RENTAL_TOTAL_PRICE_KEYS,
+    _RENTAL_CONTRACT_NUMBER_KEYS,
+    _RENTAL_STATUS_KEYS,
+)
+
+
 def _normalize_customer_row(row, row_index: int):
     """Normalize AmoCRM CSV/XLSX export rows into Customer fields."""
 
@@ -724,10 +1169,13 @@ def _normalize_customer_row(row, row_index: int):
         except (InvalidOperation, ValueError):
             return None
 
+    columns = _fold_columns(tuple(row))
+
     def pick(keys):
         for key in keys:
-            if key in row:
-                cleaned = _clean_text_value(row[key])
+            column = columns.get(_fold_header(key))
+            if column is not None:
+                cleaned = _clean_text_value(row[column])
                 if cleaned:
                     return cleaned
         return ""
@@ -884,7 +1332,7 @@ def admin_user_delete(request, user_id):
     if target_user == request.user:
         messages.error(request, "Нельзя удалить собственный аккаунт.")
         return redirect(f"{reverse('rentals:settings')}?tab=admins")
-    if target_user.is_superuser and User.objects.filter(is_superuser=True).exclude(pk=target_user.pk).count() == 0:
+    if target_user.is_superuser and not User.objects.filter(is_superuser=True).exclude(pk=target_user.pk).exists():
         messages.error(request, "Нельзя удалить последнего суперпользователя.")
         return redirect(f"{reverse('rentals:settings')}?tab=admins")
     target_user.delete()
@@ -905,12 +1353,16 @@ def password_change_self(request):
 
 @login_required
 def dashboard(request):
+    context = cache.get_or_set(DASHBOARD_CACHE_KEY, _build_dashboard_context, DASHBOARD_CACHE_TIMEOUT)
+    return render(request, "rentals/dashboard.html", context)
+
+
+def _build_dashboard_context():
+    """Aggregate the dashboard figures; the result is cached by ``dashboard``."""
     summary = rentals_summary()
-    utilization = car_utilization()[:5]
+    utilization = car_utilization(limit=5)
     monthly_trend = monthly_rental_performance()
     status_counts = rental_status_breakdown()
-    status_order = [code for code, _ in Rental.STATUS_CHOICES]
-    status_labels = dict(Rental.STATUS_CHOICES)
 
     chart_payload = {
         "trend": {
@@ -919,8 +1371,8 @@ def dashboard(request):
             "counts": [item["count"] for item in monthly_trend],
         },
         "status": {
-            "labels": [status_labels[code] for code in status_order],
-            "counts": [status_counts.get(code, 0) for code in status_order],
+            "labels": _STATUS_CHART_LABELS,
+            "counts": [status_counts.get(code, 0) for code in _STATUS_ORDER],
         },
         "topCars": {
             "labels": [
@@ -932,7 +1384,7 @@ def dashboard(request):
         },
     }
 
-    context = {
+    return {
         "cars_count": Car.objects.count(),
         "customers_count": Customer.objects.count(),
         "active_rentals": summary["active_rentals"],
@@ -942,7 +1394,6 @@ def dashboard(request):
         "top_cars": utilization,
         "chart_payload": chart_payload,
     }
-    return render(request, "rentals/dashboard.html", context)
 
 
 @method_decorator(login_required, name="dispatch")
@@ -955,20 +1406,13 @@ class CarListView(ListView):
         self.search_query = (self.request.GET.get("q") or "").strip()
 
         if self.search_query:
-            normalized_query = re.sub(r"[^0-9A-Za-zА-Яа-яЁё]", "", self.search_query).upper()
+            normalized_query = normalize_plate(self.search_query)
             if normalized_query:
-                plate_normalized = Upper(
-                    Replace(
-                        Replace(Replace(F("plate_number"), Value(" "), Value("")), Value("-"), Value("")),
-                        Value("_"),
-                        Value(""),
-                    )
-                )
-                queryset = queryset.annotate(plate_normalized=plate_normalized).filter(
-                    plate_normalized__icontains=normalized_query
-                )
+                # plate_normalized is stored upper-cased, so a plain contains is enough.
+                queryset = queryset.filter(plate_normalized__contains=normalized_query)
             else:
-                queryset = queryset.filter(plate_number__icontains=self.search_query)
+                # Only separators were typed; no plate can match them meaningfully.
+                queryset = queryset.none()
 
         return queryset.order_by("plate_number")
 
@@ -988,7 +1432,7 @@ class CarCreateView(CreateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         form = context.get("form")
-        context["loss_fee_fields"] = [form[name] for name, _ in CAR_LOSS_FEE_FIELDS] if form else []
+        context["loss_fee_fields"] = [form[name] for name in CAR_LOSS_FEE_NAMES] if form else []
         return context
 
 
@@ -1002,7 +1446,7 @@ class CarUpdateView(UpdateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         form = context.get("form")
-        context["loss_fee_fields"] = [form[name] for name, _ in CAR_LOSS_FEE_FIELDS] if form else []
+        context["loss_fee_fields"] = [form[name] for name in CAR_LOSS_FEE_NAMES] if form else []
         return context
 
 
@@ -1024,15 +1468,15 @@ def car_delete(request, pk: int):
 @login_required
 @require_POST
 def car_delete_all(request):
-    with_rentals = Car.objects.filter(rental__isnull=False).distinct()
-    deletable = Car.objects.exclude(pk__in=with_rentals.values_list("pk", flat=True))
-    deletable_count = deletable.count()
+    has_rentals = Exists(Rental.objects.filter(car=OuterRef("pk")))
+    # delete() reports per-model counts, so no separate count() is needed.
+    _, deleted = Car.objects.filter(~has_rentals).delete()
+    deletable_count = deleted.get(Car._meta.label, 0)
 
     if deletable_count:
-        deletable.delete()
         messages.success(request, f"Удалено автомобилей: {deletable_count}.")
 
-    locked_count = with_rentals.count()
+    locked_count = Car.objects.filter(has_rentals).count()
     if locked_count:
         messages.warning(
             request,
@@ -1062,17 +1506,15 @@ def customer_delete(request, pk: int):
 @login_required
 @require_POST
 def customer_delete_all(request):
-    with_rentals = Customer.objects.filter(
-        Q(rental__isnull=False) | Q(secondary_rentals__isnull=False)
-    ).distinct()
-    deletable = Customer.objects.exclude(pk__in=with_rentals.values_list("pk", flat=True))
-    deletable_count = deletable.count()
+    has_rentals = Exists(Rental.objects.filter(Q(customer=OuterRef("pk")) | Q(second_driver=OuterRef("pk"))))
+    # The total from delete() includes tag links, so read the customer count.
+    _, deleted = Customer.objects.filter(~has_rentals).delete()
+    deletable_count = deleted.get(Customer._meta.label, 0)
 
     if deletable_count:
-        deletable.delete()
         messages.success(request, f"Удалено клиентов: {deletable_count}.")
 
-    locked_count = with_rentals.count()
+    locked_count = Customer.objects.filter(has_rentals).count()
     if locked_count:
         messages.warning(
             request,
@@ -1131,15 +1573,19 @@ class CustomerListView(ListView):
                 continue
 
         if self.search_query:
-            terms = [term for term in re.split(r"\s+", self.search_query) if term]
+            terms = self.search_query.split()
             for term in terms:
                 date_value = _parse_date(term)
                 discount_value = None
-                try:
-                    cleaned_term = str(term).replace("%", "").replace(",", ".")
-                    discount_value = Decimal(cleaned_term)
-                except (InvalidOperation, ValueError):
-                    discount_value = None
+                # Only numeric-looking terms are tried as a discount; this also keeps
+                # words like "nan" or "Infinity" from turning into Decimal values.
+                if _NUMERIC_TERM_RE.fullmatch(term):
+                    try:
+                        discount_value = Decimal(term.replace("%", "").replace(",", "."))
+                    except (InvalidOperation, ValueError):
+                        discount_value = None
+                # The icontains columns are covered by trigram GIN indexes on PostgreSQL
+                # (migration 0020); keep this list in sync with CUSTOMER_SEARCH_COLUMNS there.
                 condition = (
                     Q(full_name__icontains=term)
                     | Q(phone__icontains=term)
@@ -1150,7 +1596,9 @@ class CustomerListView(ListView):
                     | Q(passport_series__icontains=term)
                     | Q(passport_number__icontains=term)
                     | Q(passport_issued_by__icontains=term)
-                    | Q(tags__name__icontains=term)
+                    | Exists(
+                        Customer.tags.through.objects.filter(customer=OuterRef("pk"), customertag__name__icontains=term)
+                    )
                 )
                 if date_value:
                     condition |= Q(passport_issue_date=date_value) | Q(birth_date=date_value) | Q(driving_since=date_value)
@@ -1159,10 +1607,13 @@ class CustomerListView(ListView):
                 queryset = queryset.filter(condition)
 
         if self.active_tags:
-            queryset = queryset.filter(tags__id__in=self.active_tags)
+            queryset = queryset.filter(
+                Exists(Customer.tags.through.objects.filter(customer=OuterRef("pk"), customertag__in=self.active_tags))
+            )
 
+        # Tags are matched with EXISTS semi-joins, so rows never repeat and need no DISTINCT.
         ordering = self.sort_map[self.sort_key]
-        return queryset.distinct().order_by(*ordering)
+        return queryset.order_by(*ordering)
 
     def get_paginate_by(self, queryset):
         if hasattr(self, "_page_size"):
@@ -1182,7 +1633,7 @@ class CustomerListView(ListView):
         context["page_size_options"] = self.page_size_options
         context["current_page_size"] = getattr(self, "_page_size", self.paginate_by)
         context["search_query"] = getattr(self, "search_query", "")
-        context["available_tags"] = CustomerTag.objects.all()
+        context["available_tags"] = _customer_tag_choices()
         context["active_tags"] = getattr(self, "active_tags", [])
         context["sort_options"] = self.sort_options
         context["active_sort"] = getattr(self, "sort_key", self.default_sort)
@@ -1219,6 +1670,7 @@ class CustomerUpdateView(UpdateView):
 class RentalListView(ListView):
     model = Rental
     template_name = "rentals/rental_list.html"
+    paginate_by = 25
 
     def get_queryset(self):
         queryset = super().get_queryset().select_related("car", "customer", "second_driver")
@@ -1229,7 +1681,7 @@ class RentalListView(ListView):
             queryset = queryset.filter(status=self.status_filter)
 
         if self.search_query:
-            terms = [term for term in re.split(r"\s+", self.search_query) if term]
+            terms = self.search_query.split()
             for term in terms:
                 date_value = _parse_date(term)
                 condition = (
@@ -1255,11 +1707,14 @@ class RentalListView(ListView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["contract_templates"] = ContractTemplate.objects.all()
+        context["contract_templates"] = _contract_template_choices()
         context["search_query"] = getattr(self, "search_query", "")
         context["status_filter"] = getattr(self, "status_filter", "")
         context["filters_active"] = bool(getattr(self, "search_query", "") or getattr(self, "status_filter", ""))
         context["rental_status_choices"] = Rental.STATUS_CHOICES
+        query_params = self.request.GET.copy()
+        query_params.pop("page", None)
+        context["querystring"] = f"&{query_params.urlencode()}" if query_params else ""
         return context
 
 
@@ -1276,14 +1731,14 @@ class RentalCreateView(CreateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["car_pricing"] = [_serialize_car_pricing(car) for car in Car.objects.all()]
+        context["car_pricing"] = _car_pricing_payload()
         context["car_initial_label"] = getattr(context.get("form"), "initial_car_label", "")
         context["customer_initial_label"] = getattr(context.get("form"), "initial_customer_label", "")
         context["second_driver_initial_label"] = getattr(
             context.get("form"), "initial_second_driver_label", ""
         )
         context["pricing_config"] = pricing_config()
-        context["contract_templates"] = ContractTemplate.objects.all()
+        context["contract_templates"] = _contract_template_choices()
         return context
 
 
@@ -1309,14 +1764,14 @@ class RentalWizardView(CreateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["car_pricing"] = [_serialize_car_pricing(car) for car in Car.objects.all()]
+        context["car_pricing"] = _car_pricing_payload()
         context["car_initial_label"] = getattr(context.get("form"), "initial_car_label", "")
         context["customer_initial_label"] = getattr(context.get("form"), "initial_customer_label", "")
         context["second_driver_initial_label"] = getattr(
             context.get("form"), "initial_second_driver_label", ""
         )
         context["pricing_config"] = pricing_config()
-        context["contract_templates"] = ContractTemplate.objects.all()
+        context["contract_templates"] = _contract_template_choices()
         return context
 
 
@@ -1336,14 +1791,14 @@ class RentalUpdateView(UpdateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["car_pricing"] = [_serialize_car_pricing(car) for car in Car.objects.all()]
+        context["car_pricing"] = _car_pricing_payload()
         context["car_initial_label"] = getattr(context.get("form"), "initial_car_label", "")
         context["customer_initial_label"] = getattr(context.get("form"), "initial_customer_label", "")
         context["second_driver_initial_label"] = getattr(
             context.get("form"), "initial_second_driver_label", ""
         )
         context["pricing_config"] = pricing_config()
-        context["contract_templates"] = ContractTemplate.objects.all()
+        context["contract_templates"] = _contract_template_choices()
         return context
 
 
@@ -1402,8 +1857,11 @@ class BusinessSettingsUpdateView(UpdateView):
             active_tab = "general"
         context["active_tab"] = active_tab
         if self.request.user.is_superuser:
-            context.setdefault("admins", User.objects.filter(is_staff=True).order_by("username"))
-            context.setdefault("superuser_count", User.objects.filter(is_superuser=True).count())
+            if active_tab == "admins" and "admins" not in context:
+                # One query serves both the staff list and the superuser count.
+                users = list(User.objects.filter(Q(is_staff=True) | Q(is_superuser=True)).order_by("username"))
+                context["admins"] = [user for user in users if user.is_staff]
+                context["superuser_count"] = sum(user.is_superuser for user in users)
             context.setdefault("admin_form", kwargs.get("admin_form") or AdminUserCreationForm())
         return context
 
@@ -1442,7 +1900,7 @@ def customer_search(request):
     if not term:
         return JsonResponse({"results": []})
 
-    terms = [piece for piece in re.split(r"\s+", term) if piece]
+    terms = term.split()
     matches = Customer.objects.all()
     for piece in terms:
         date_value = _parse_date(piece)
@@ -1455,13 +1913,14 @@ def customer_search(request):
             | Q(registration_address__icontains=piece)
             | Q(passport_number__icontains=piece)
             | Q(passport_series__icontains=piece)
-            | Q(tags__name__icontains=piece)
+            # A semi-join on tags needs no DISTINCT, unlike joining them in.
+            | Exists(Customer.tags.through.objects.filter(customer=OuterRef("pk"), customertag__name__icontains=piece))
         )
         if date_value:
             condition |= Q(birth_date=date_value) | Q(driving_since=date_value) | Q(passport_issue_date=date_value)
         matches = matches.filter(condition)
 
-    matches = matches.order_by("full_name").distinct()[:limit]
+    matches = matches.only("id", "full_name", "phone", "email", "license_number").order_by("full_name")[:limit]
 
     results = []
     for customer in matches:
@@ -1535,57 +1994,109 @@ def customer_profile(request, pk: int):
     )
 
 
-@login_required
-def export_cars_csv(request):
-    response = HttpResponse(content_type="text/csv")
-    filename = "автомобили.csv"
+EXPORT_CHUNK_SIZE = 2000
+# Columns read by the exports below; the car export writes every Car column, so it needs no projection.
+_CUSTOMER_EXPORT_FIELDS = (
+    "full_name",
+    "birth_date",
+    "email",
+    "phone",
+    "license_number",
+    "license_issued_by",
+    "driving_since",
+    "driving_since_year_only",
+    "passport_series",
+    "passport_number",
+    "passport_issue_date",
+    "passport_issued_by",
+    "registration_address",
+    "discount_percent",
+)
+_RENTAL_EXPORT_FIELDS = (
+    "contract_number",
+    "start_date",
+    "end_date",
+    "daily_rate",
+    "total_price",
+    "status",
+    "car__plate_number",
+    "customer__license_number",
+    "customer__full_name",
+)
+
+
+def _stream_csv_response(filename: str, header: list, rows) -> StreamingHttpResponse:
+    """Stream rows as CSV, formatting them into one chunk per EXPORT_CHUNK_SIZE rows."""
+
+    def stream():
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        def flush():
+            chunk = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            return chunk
+
+        writer.writerow(header)
+        yield flush()
+        row_iter = iter(rows)
+        while True:
+            writer.writerows(islice(row_iter, EXPORT_CHUNK_SIZE))
+            chunk = flush()
+            if not chunk:
+                break
+            yield chunk
+
+    response = StreamingHttpResponse(stream(), content_type="text/csv")
     response["Content-Disposition"] = f"attachment; filename*=UTF-8''{quote(filename)}"
+    return response
 
-    writer = csv.writer(response)
-    writer.writerow(
-        [
-            "Госномер",
-            "Марка",
-            "Модель",
-            "Год выпуска",
-            "ВИН",
-            "Цвет",
-            "Регион",
-            "Фото (ссылка)",
-            "Номер СТС",
-            "Дата выдачи СТС",
-            "Кем выдана СТС",
-            "Свидетельство о регистрации",
-            "Объем бака, л",
-            "Стоимость полного бака, ₽",
-            "Залог",
-            "Базовый тариф",
-            "1-4 дня (вс)",
-            "5-14 дней (вс)",
-            "15+ дней (вс)",
-            "1-4 дня (нс)",
-            "5-14 дней (нс)",
-            "15+ дней (нс)",
-            "Активен",
-            *[label for _, label in CAR_LOSS_FEE_FIELDS],
-        ]
-    )
 
-    for car in Car.objects.all():
-        writer.writerow(
-            [
-                smart_str(car.plate_number),
-                smart_str(car.make),
-                smart_str(car.model),
+@login_required
+def export_cars_csv(request):
+    header = [
+        "Госномер",
+        "Марка",
+        "Модель",
+        "Год выпуска",
+        "ВИН",
+        "Цвет",
+        "Регион",
+        "Фото (ссылка)",
+        "Номер СТС",
+        "Дата выдачи СТС",
+        "Кем выдана СТС",
+        "Свидетельство о регистрации",
+        "Объем бака, л",
+        "Стоимость полного бака, ₽",
+        "Залог",
+        "Базовый тариф",
+        "1-4 дня (вс)",
+        "5-14 дней (вс)",
+        "15+ дней (вс)",
+        "1-4 дня (нс)",
+        "5-14 дней (нс)",
+        "15+ дней (нс)",
+        "Активен",
+        *[label for _, label in CAR_LOSS_FEE_FIELDS],
+    ]
+
+    def rows():
+        for car in Car.objects.all().iterator(chunk_size=EXPORT_CHUNK_SIZE):
+            yield [
+                car.plate_number,
+                car.make,
+                car.model,
                 car.year,
-                smart_str(car.vin),
-                smart_str(car.color),
-                smart_str(car.region_code),
-                smart_str(car.photo_url),
-                smart_str(car.sts_number),
+                car.vin,
+                car.color,
+                car.region_code,
+                car.photo_url,
+                car.sts_number,
                 car.sts_issue_date.strftime("%d-%m-%Y") if car.sts_issue_date else "",
-                smart_str(car.sts_issued_by),
-                smart_str(car.registration_certificate_info),
+                car.sts_issued_by,
+                car.registration_certificate_info,
                 car.fuel_tank_volume_liters if car.fuel_tank_volume_liters is not None else "",
                 car.fuel_tank_cost_rub if car.fuel_tank_cost_rub is not None else "",
                 car.security_deposit if car.security_deposit is not None else "",
@@ -1599,105 +2110,228 @@ def export_cars_csv(request):
                 "Да" if car.is_active else "Нет",
                 *[
                     getattr(car, field) if getattr(car, field) is not None else ""
-                    for field, _ in CAR_LOSS_FEE_FIELDS
+                    for field in CAR_LOSS_FEE_NAMES
                 ],
             ]
-        )
 
-    return response
+    return _stream_csv_response("автомобили.csv", header, rows())
 
 
 @login_required
 def export_customers_csv(request):
-    response = HttpResponse(content_type="text/csv")
-    filename = "клиенты.csv"
-    response["Content-Disposition"] = f"attachment; filename*=UTF-8''{quote(filename)}"
-
-    writer = csv.writer(response)
-    writer.writerow(
-        [
-            "ФИО",
-            "Дата рождения",
-            "Эл. почта",
-            "Телефон",
-            "Номер ВУ",
-            "Кем выдано ВУ",
-            "Стаж с",
-            "Серия паспорта",
-            "Номер паспорта",
-            "Дата выдачи паспорта",
-            "Кем выдан паспорт",
-            "Адрес прописки",
-            "Скидка, %",
-            "Теги",
-        ]
-    )
-
-    for customer in Customer.objects.prefetch_related("tags"):
-        tags = "; ".join(customer.tags.values_list("name", flat=True))
-        writer.writerow(
-            [
-                smart_str(customer.full_name),
+    header = [
+        "ФИО",
+        "Дата рождения",
+        "Эл. почта",
+        "Телефон",
+        "Номер ВУ",
+        "Кем выдано ВУ",
+        "Стаж с",
+        "Серия паспорта",
+        "Номер паспорта",
+        "Дата выдачи паспорта",
+        "Кем выдан паспорт",
+        "Адрес прописки",
+        "Скидка, %",
+        "Теги",
+    ]
+
+    def rows():
+        customers = (
+            Customer.objects.only(*_CUSTOMER_EXPORT_FIELDS)
+            .prefetch_related(Prefetch("tags", queryset=CustomerTag.objects.only("name")))
+            .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        )
+        for customer in customers:
+            # Read from the prefetch cache; values_list() would issue a query per customer.
+            tags = "; ".join(tag.name for tag in customer.tags.all())
+            yield [
+                customer.full_name,
                 customer.birth_date.strftime("%d-%m-%Y") if customer.birth_date else "",
-                smart_str(customer.email or ""),
-                smart_str(customer.phone or ""),
-                smart_str(customer.license_number),
-                smart_str(customer.license_issued_by or ""),
+                customer.email or "",
+                customer.phone or "",
+                customer.license_number,
+                customer.license_issued_by or "",
                 (
                     customer.driving_since.strftime("%Y")
                     if customer.driving_since and customer.driving_since_year_only
                     else customer.driving_since.strftime("%d-%m-%Y") if customer.driving_since else ""
                 ),
-                smart_str(customer.passport_series or ""),
-                smart_str(customer.passport_number or ""),
+                customer.passport_series or "",
+                customer.passport_number or "",
                 customer.passport_issue_date.strftime("%d-%m-%Y") if customer.passport_issue_date else "",
-                smart_str(customer.passport_issued_by or ""),
-                smart_str(customer.registration_address or ""),
-                smart_str(customer.discount_percent if customer.discount_percent is not None else ""),
-                smart_str(tags),
+                customer.passport_issued_by or "",
+                customer.registration_address or "",
+                customer.discount_percent if customer.discount_percent is not None else "",
+                tags,
             ]
-        )
 
-    return response
+    return _stream_csv_response("клиенты.csv", header, rows())
 
 
 @login_required
 def export_rentals_csv(request):
-    response = HttpResponse(content_type="text/csv")
-    filename = "аренды.csv"
-    response["Content-Disposition"] = f"attachment; filename*=UTF-8''{quote(filename)}"
-
-    writer = csv.writer(response)
-    writer.writerow(
-        [
-            "Номер договора",
-            "Госномер",
-            "Номер ВУ",
-            "Клиент",
-            "Дата начала",
-            "Дата окончания",
-            "Суточный тариф",
-            "Итоговая сумма",
-            "Статус",
-        ]
-    )
-
-    for rental in Rental.objects.select_related("car", "customer", "second_driver"):
-        writer.writerow(
-            [
-                smart_str(rental.contract_number),
-                smart_str(rental.car.plate_number),
-                smart_str(rental.customer.license_number),
-                smart_str(rental.customer.full_name),
+    header = [
+        "Номер договора",
+        "Госномер",
+        "Номер ВУ",
+        "Клиент",
+        "Дата начала",
+        "Дата окончания",
+        "Суточный тариф",
+        "Итоговая сумма",
+        "Статус",
+    ]
+
+    def rows():
+        rentals = (
+            Rental.objects.select_related("car", "customer")
+            .only(*_RENTAL_EXPORT_FIELDS)
+            .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        )
+        for rental in rentals:
+            yield [
+                rental.contract_number,
+                rental.car.plate_number,
+                rental.customer.license_number,
+                rental.customer.full_name,
                 rental.start_date.strftime("%d-%m-%Y"),
                 rental.end_date.strftime("%d-%m-%Y"),
                 rental.daily_rate,
                 rental.total_price,
                 rental.get_status_display(),
             ]
-        )
 
-    return response
+    return _stream_csv_response("аренды.csv", header, rows())
+
+
+# Static parts of the import pages.
+_CAR_IMPORT_HEADERS = (
+    "Госномер",
+    "ВИН",
+    "Цвет",
+    "Регион",
+    "Фото (ссылка)",
+    "Марка",
+    "Модель",
+    "Год выпуска",
+    "Номер СТС",
+    "Дата выдачи СТС (ДД-ММ-ГГГГ)",
+    "Кем выдана СТС",
+    "Свидетельство о регистрации",
+    "Объем бака, л",
+    "Стоимость полного бака, ₽",
+    "Залог",
+    "Базовый тариф",
+    "1-4 дня (вс)",
+    "5-14 дней (вс)",
+    "15+ дней (вс)",
+    "1-4 дня (нс)",
+    "5-14 дней (нс)",
+    "15+ дней (нс)",
+    "Активен",
+    *[label for _, label in CAR_LOSS_FEE_FIELDS],
+)
+
+_CAR_IMPORT_XLS_HEADERS = (
+    "Регистрационный знак",
+    "ВИН",
+    "Цвет",
+    "Регион",
+    "Фото (ссылка)",
+    "Марка",
+    "Год выпуска",
+    "СТС",
+    "Свидетельство о регистрации",
+    "Объем бака",
+    "Объем бака(руб.)",
+    "Залог",
+    "1-4 дней(вс)",
+    "5-14 дней(вс)",
+    "15 дней и более(вс)",
+    "1-4 дней(нс)",
+    "5-14 дней(нс)",
+    "15 дней и более(нс)",
+    *[label for _, label in CAR_LOSS_FEE_FIELDS],
+)
+
+# Fields the customer importer overwrites on customers that already exist.
+CUSTOMER_IMPORT_UPDATE_FIELDS = (
+    "full_name",
+    "birth_date",
+    "email",
+    "phone",
+    "license_issued_by",
+    "driving_since",
+    "driving_since_year_only",
+    "registration_address",
+    "passport_series",
+    "passport_number",
+    "passport_issued_by",
+    "passport_issue_date",
+    "discount_percent",
+)
+# Compares all of them as one tuple instead of a getattr() per field.
+_customer_import_values = attrgetter(*CUSTOMER_IMPORT_UPDATE_FIELDS)
+
+_CUSTOMER_IMPORT_HEADERS = (
+    "ФИО / Наименование",
+    "Имя",
+    "Фамилия",
+    "Телефон (контакт) / Мобильный телефон / Рабочий телефон",
+    "Номер ВУ / Водит. удостоверение. (контакт)",
+    "Кем выдано ВУ",
+    "Стаж с",
+    "Дата рождения",
+    "Скидка, %",
+    "Эл. почта (рабочая/личная/другая)",
+    "Адрес прописки",
+    "Серия паспорта",
+    "Номер паспорта",
+    "Кем выдан паспорт",
+    "Дата выдачи паспорта (ДД-ММ-ГГГГ / ДД.ММ.ГГГГ)",
+    "Теги (через запятую)",
+    "ИД (резервный идентификатор)",
+)
+
+_RENTAL_IMPORT_HEADERS = (
+    "Номер договора",
+    "Госномер",
+    "Номер ВУ",
+    "Клиент",
+    "Дата начала",
+    "Дата окончания",
+    "Суточный тариф",
+    "Итоговая сумма",
+    "Статус",
+)
+
+_CAR_LIST_URL = reverse_lazy("rentals:car_list")
+_CUSTOMER_LIST_URL = reverse_lazy("rentals:customer_list")
+_RENTAL_LIST_URL = reverse_lazy("rentals:rental_list")
+
+# Upload page contexts; render() layers them into a fresh Context, so sharing is safe.
+_CAR_IMPORT_CONTEXT = {
+    "title": "Импорт автомобилей",
+    "expected_headers": _CAR_IMPORT_HEADERS,
+    "xls_headers": _CAR_IMPORT_XLS_HEADERS,
+    "help_text": "Загрузите таблицу Эксель или файл с разделителями. Поддерживается русский шаблон Эксель, а также ступенчатые тарифы для высокого/низкого сезона. Можно импортировать цвет, регион, ссылку на фото, параметры бака, залог и цены при утере комплектующих. Авто с совпадающим госномером будут обновлены без очистки пропущенных полей.",
+    "back_url": _CAR_LIST_URL,
+}
+
+_CUSTOMER_IMPORT_CONTEXT = {
+    "title": "Импорт клиентов",
+    "expected_headers": _CUSTOMER_IMPORT_HEADERS,
+    "help_text": "Загрузите таблицу Эксель или файл с разделителями. Строки сопоставляются по номеру ВУ, затем по идентификатору/телефону из АмоСРМ. Пустые значения заполняются автоматически. Адрес (контакт/фактический) при импорте кладётся в адрес прописки.",
+    "back_url": _CUSTOMER_LIST_URL,
+}
+
+_RENTAL_IMPORT_CONTEXT = {
+    "title": "Импорт аренд",
+    "expected_headers": _RENTAL_IMPORT_HEADERS,
+    "help_text": "Перед импортом аренды должны быть заведены автомобили и клиенты. Номер договора можно не указывать.",
+    "back_url": _RENTAL_LIST_URL,
+}
 
 
 @login_required
@@ -1708,137 +2342,41 @@ def import_cars_csv(request):
             messages.error(request, "Пожалуйста, выберите таблицу Эксель или файл с разделителями.")
         else:
             try:
-                rows = _load_rows(upload)
+                # Only columns that map to a car field are read from spreadsheets.
+                rows = _open_rows(upload, _CAR_FIELD_ALIASES)
             except Exception as exc:  # noqa: BLE001 - present message to user
                 logger.exception("Импорт авто: не удалось прочитать файл %s", upload.name)
                 messages.error(request, "Не удалось прочитать файл. Проверьте формат и кодировку.")
                 return redirect("rentals:import_cars_csv")
 
-            if not rows:
+            if rows is None:
                 messages.warning(request, "Файл пустой или не содержит строк.")
                 return redirect("rentals:import_cars_csv")
 
             imported, skipped = 0, 0
-
-            for row in rows:
-                normalized = _normalize_car_row(row)
-
-                plate = normalized["plate_number"]
-                make = normalized["make"]
-                model = normalized["model"]
-                year = normalized["year"]
-                vin = normalized["vin"]
-                color = normalized.get("color")
-                region_code = normalized.get("region_code")
-                photo_url = normalized.get("photo_url")
-                sts_number = normalized["sts_number"]
-                sts_issue_date = normalized["sts_issue_date"]
-                sts_issued_by = normalized["sts_issued_by"]
-                registration_certificate_info = normalized.get("registration_certificate_info")
-                fuel_tank_volume_liters = normalized.get("fuel_tank_volume_liters")
-                fuel_tank_cost_rub = normalized.get("fuel_tank_cost_rub")
-                security_deposit = normalized.get("security_deposit")
-                daily_rate = normalized["daily_rate"]
-                rate_1_4_high = normalized["rate_1_4_high"]
-                rate_5_14_high = normalized["rate_5_14_high"]
-                rate_15_high = normalized["rate_15_high"]
-                rate_1_4_low = normalized["rate_1_4_low"]
-                rate_5_14_low = normalized["rate_5_14_low"]
-                rate_15_low = normalized["rate_15_low"]
-                loss_fee_values = {field: normalized.get(field) for field, _ in CAR_LOSS_FEE_FIELDS}
-
-                has_rate = any(
-                    rate not in (None, Decimal("0"))
-                    for rate in (
-                        daily_rate,
-                        rate_1_4_high,
-                        rate_5_14_high,
-                        rate_15_high,
-                        rate_1_4_low,
-                        rate_5_14_low,
-                        rate_15_low,
-                    )
-                )
-
-                if not plate or not make or not model or not year or not has_rate:
-                    skipped += 1
-                    continue
-
-                base_daily_rate = daily_rate or rate_1_4_high or rate_1_4_low or Decimal("0")
-
-                defaults = {
-                    "make": make,
-                    "model": model,
-                    "year": year,
-                    "vin": vin or None,
-                    "color": color or None,
-                    "region_code": region_code or None,
-                    "photo_url": photo_url or None,
-                    "sts_number": sts_number or None,
-                    "sts_issue_date": sts_issue_date,
-                    "sts_issued_by": sts_issued_by or None,
-                    "registration_certificate_info": registration_certificate_info or None,
-                    "fuel_tank_volume_liters": fuel_tank_volume_liters,
-                    "fuel_tank_cost_rub": fuel_tank_cost_rub,
-                    "security_deposit": security_deposit,
-                    "daily_rate": base_daily_rate,
-                    "rate_1_4_high": rate_1_4_high or Decimal("0"),
-                    "rate_5_14_high": rate_5_14_high or Decimal("0"),
-                    "rate_15_plus_high": rate_15_high or Decimal("0"),
-                    "rate_1_4_low": rate_1_4_low or Decimal("0"),
-                    "rate_5_14_low": rate_5_14_low or Decimal("0"),
-                    "rate_15_plus_low": rate_15_low or Decimal("0"),
-                    "is_active": normalized["is_active"],
-                    **loss_fee_values,
-                }
-
-                car, created = Car.objects.get_or_create(plate_number=plate, defaults=defaults)
-                if not created:
-                    car.make = make or car.make
-                    car.model = model or car.model
-                    car.year = year or car.year
-                    if vin:
-                        car.vin = vin
-                    if color:
-                        car.color = color
-                    if region_code:
-                        car.region_code = region_code
-                    if photo_url:
-                        car.photo_url = photo_url
-                    if sts_number:
-                        car.sts_number = sts_number
-                    if sts_issue_date:
-                        car.sts_issue_date = sts_issue_date
-                    if sts_issued_by:
-                        car.sts_issued_by = sts_issued_by
-                    if registration_certificate_info:
-                        car.registration_certificate_info = registration_certificate_info
-                    if fuel_tank_volume_liters is not None:
-                        car.fuel_tank_volume_liters = fuel_tank_volume_liters
-                    if fuel_tank_cost_rub is not None:
-                        car.fuel_tank_cost_rub = fuel_tank_cost_rub
-                    if security_deposit is not None:
-                        car.security_deposit = security_deposit
-                    if base_daily_rate is not None:
-                        car.daily_rate = base_daily_rate
-                    if rate_1_4_high is not None:
-                        car.rate_1_4_high = rate_1_4_high
-                    if rate_5_14_high is not None:
-                        car.rate_5_14_high = rate_5_14_high
-                    if rate_15_high is not None:
-                        car.rate_15_plus_high = rate_15_high
-                    if rate_1_4_low is not None:
-                        car.rate_1_4_low = rate_1_4_low
-                    if rate_5_14_low is not None:
-                        car.rate_5_14_low = rate_5_14_low
-                    if rate_15_low is not None:
-                        car.rate_15_plus_low = rate_15_low
-                    for field, value in loss_fee_values.items():
-                        if value is not None:
-                            setattr(car, field, value)
-                    car.is_active = normalized["is_active"]
-                    car.save()
-                imported += 1
+            try:
+                with _import_transaction():
+                    # Each chunk is written before the next one is read, so plates repeated
+                    # across chunks are merged onto the already-saved car.
+                    while chunk := list(islice(rows, CAR_IMPORT_BATCH_SIZE)):
+                        parsed = []
+                        for row in chunk:
+                            payload = _car_import_payload(_normalize_car_row(row))
+                            if payload is None:
+                                skipped += 1
+                                continue
+                            parsed.append(payload)
+                        _upsert_cars(parsed)
+                        imported += len(parsed)
+            except ImportReadError:
+                # The transaction is rolled back, so nothing from the file is saved.
+                logger.exception("Импорт авто: не удалось прочитать файл %s", upload.name)
+                messages.error(request, "Не удалось прочитать файл. Проверьте формат и кодировку.")
+                return redirect("rentals:import_cars_csv")
+            if imported:
+                # bulk_create skips post_save, so drop the cached payloads explicitly.
+                invalidate_car_pricing()
+                invalidate_dashboard()
 
             if imported:
                 messages.success(request, f"Импортировано автомобилей: {imported}.")
@@ -1847,62 +2385,7 @@ def import_cars_csv(request):
 
             return redirect("rentals:car_list")
 
-    return render(
-        request,
-        "rentals/import_csv.html",
-        {
-            "title": "Импорт автомобилей",
-            "expected_headers": [
-                "Госномер",
-                "ВИН",
-                "Цвет",
-                "Регион",
-                "Фото (ссылка)",
-                "Марка",
-                "Модель",
-                "Год выпуска",
-                "Номер СТС",
-                "Дата выдачи СТС (ДД-ММ-ГГГГ)",
-                "Кем выдана СТС",
-                "Свидетельство о регистрации",
-                "Объем бака, л",
-                "Стоимость полного бака, ₽",
-                "Залог",
-                "Базовый тариф",
-                "1-4 дня (вс)",
-                "5-14 дней (вс)",
-                "15+ дней (вс)",
-                "1-4 дня (нс)",
-                "5-14 дней (нс)",
-                "15+ дней (нс)",
-                "Активен",
-                *[label for _, label in CAR_LOSS_FEE_FIELDS],
-            ],
-            "xls_headers": [
-                "Регистрационный знак",
-                "ВИН",
-                "Цвет",
-                "Регион",
-                "Фото (ссылка)",
-                "Марка",
-                "Год выпуска",
-                "СТС",
-                "Свидетельство о регистрации",
-                "Объем бака",
-                "Объем бака(руб.)",
-                "Залог",
-                "1-4 дней(вс)",
-                "5-14 дней(вс)",
-                "15 дней и более(вс)",
-                "1-4 дней(нс)",
-                "5-14 дней(нс)",
-                "15 дней и более(нс)",
-                *[label for _, label in CAR_LOSS_FEE_FIELDS],
-            ],
-            "help_text": "Загрузите таблицу Эксель или файл с разделителями. Поддерживается русский шаблон Эксель, а также ступенчатые тарифы для высокого/низкого сезона. Можно импортировать цвет, регион, ссылку на фото, параметры бака, залог и цены при утере комплектующих. Авто с совпадающим госномером будут обновлены без очистки пропущенных полей.",
-            "back_url": reverse("rentals:car_list"),
-        },
-    )
+    return render(request, "rentals/import_csv.html", _CAR_IMPORT_CONTEXT)
 
 
 @login_required
@@ -1913,82 +2396,66 @@ def import_customers_csv(request):
             messages.error(request, "Пожалуйста, выберите таблицу Эксель или файл с разделителями.")
         else:
             try:
-                rows = _load_rows(upload)
+                rows = _open_rows(upload)
             except Exception as exc:  # noqa: BLE001 - show error to user
                 logger.exception("Импорт клиентов: не удалось прочитать файл %s", upload.name)
                 messages.error(request, "Не удалось прочитать файл. Проверьте формат и кодировку.")
                 return redirect("rentals:import_customers_csv")
 
-            if not rows:
+            if rows is None:
                 messages.warning(request, "Файл пустой или не содержит строк.")
                 return redirect("rentals:import_customers_csv")
 
             created_count, updated_count, skipped_empty = 0, 0, 0
-            normalized_rows = []
-            for idx, row in enumerate(rows, start=1):
-                if not any(_clean_text_value(value) for value in row.values()):
-                    skipped_empty += 1
-                    continue
-
-                normalized = _normalize_customer_row(row, idx)
-                normalized_rows.append(normalized)
+            # Normalize and deduplicate by license number in the same pass over
+            # the streamed rows, so only one normalized row per license is kept.
+            by_license = {}
+            duplicate_rows = 0
+            tags_by_license = {}
+            try:
+                for idx, row in enumerate(rows, start=1):
+                    if not any(_clean_text_value(value) for value in row.values()):
+                        skipped_empty += 1
+                        continue
+
+                    item = _normalize_customer_row(row, idx)
+                    key = item["license_number"]
+                    if key in by_license:
+                        duplicate_rows += 1
+                    by_license[key] = item
+                    if item.get("tags") is not None:
+                        tags_by_license[key] = item["tags"]
+            except ImportReadError:
+                # Nothing is written until the whole file has been read.
+                logger.exception("Импорт клиентов: не удалось прочитать файл %s", upload.name)
+                messages.error(request, "Не удалось прочитать файл. Проверьте формат и кодировку.")
+                return redirect("rentals:import_customers_csv")
 
-            if not normalized_rows:
+            if not by_license:
                 messages.warning(request, "Не найдено корректных строк для импорта.")
                 return redirect("rentals:import_customers_csv")
 
-            # Deduplicate by license number inside the upload.
-            by_license = {}
-            duplicate_rows = 0
-            tags_by_license = {}
-            for item in normalized_rows:
-                key = item["license_number"]
-                if key in by_license:
-                    duplicate_rows += 1
-                by_license[key] = item
-                if item.get("tags") is not None:
-                    tags_by_license[key] = item["tags"]
-
-            licenses = list(by_license.keys())
             existing = {
                 c.license_number: c
-                for c in Customer.objects.filter(license_number__in=licenses)
+                for c in Customer.objects.filter(license_number__in=by_license)
             }
 
             to_create = []
             to_update = []
-            update_fields = (
-                "full_name",
-                "birth_date",
-                "email",
-                "phone",
-                "license_issued_by",
-                "driving_since",
-                "driving_since_year_only",
-                "registration_address",
-                "passport_series",
-                "passport_number",
-                "passport_issued_by",
-                "passport_issue_date",
-                "discount_percent",
-            )
             for license_number, data in by_license.items():
                 if license_number in existing:
                     customer = existing[license_number]
-                    changed = False
-                    for field in update_fields:
-                        new_value = data.get(field)
-                        if getattr(customer, field) != new_value:
-                            setattr(customer, field, new_value)
-                            changed = True
-                    if changed:
+                    new_values = tuple(data.get(field) for field in CUSTOMER_IMPORT_UPDATE_FIELDS)
+                    if _customer_import_values(customer) != new_values:
+                        for field, value in zip(CUSTOMER_IMPORT_UPDATE_FIELDS, new_values):
+                            setattr(customer, field, value)
                         to_update.append(customer)
                 else:
                     payload = {key: value for key, value in data.items() if key != "tags"}
                     to_create.append(Customer(**payload))
 
             if to_create or to_update:
-                with transaction.atomic():
+                with _import_transaction():
                     if to_create:
                         created = Customer.objects.bulk_create(to_create, batch_size=IMPORT_BATCH_SIZE)
                         created_count = len(created)
@@ -1997,18 +2464,19 @@ def import_customers_csv(request):
                     if to_update:
                         Customer.objects.bulk_update(
                             to_update,
-                            update_fields,
+                            CUSTOMER_IMPORT_UPDATE_FIELDS,
                             batch_size=IMPORT_BATCH_SIZE,
                         )
                         updated_count = len(to_update)
+            if created_count:
+                # bulk_create skips post_save, so refresh the dashboard customer count.
+                invalidate_dashboard()
 
             # Apply tag updates even when field values did not change,
             # so re-importing the same file can still fix tag sync issues.
             if tags_by_license:
-                _sync_customer_tags(
-                    {license_number: existing.get(license_number) for license_number in licenses},
-                    tags_by_license,
-                )
+                # `existing` now maps every imported license (old and new) to its customer.
+                _sync_customer_tags(existing, tags_by_license)
 
             imported = created_count + updated_count
 
@@ -2043,34 +2511,169 @@ def import_customers_csv(request):
 
             return redirect("rentals:customer_list")
 
-    return render(
-        request,
-        "rentals/import_csv.html",
-        {
-            "title": "Импорт клиентов",
-            "expected_headers": [
-                "ФИО / Наименование",
-                "Имя",
-                "Фамилия",
-                "Телефон (контакт) / Мобильный телефон / Рабочий телефон",
-                "Номер ВУ / Водит. удостоверение. (контакт)",
-                "Кем выдано ВУ",
-                "Стаж с",
-                "Дата рождения",
-                "Скидка, %",
-                "Эл. почта (рабочая/личная/другая)",
-                "Адрес прописки",
-                "Серия паспорта",
-                "Номер паспорта",
-                "Кем выдан паспорт",
-                "Дата выдачи паспорта (ДД-ММ-ГГГГ / ДД.ММ.ГГГГ)",
-                "Теги (через запятую)",
-                "ИД (резервный идентификатор)",
-            ],
-            "help_text": "Загрузите таблицу Эксель или файл с разделителями. Строки сопоставляются по номеру ВУ, затем по идентификатору/телефону из АмоСРМ. Пустые значения заполняются автоматически. Адрес (контакт/фактический) при импорте кладётся в адрес прописки.",
-            "back_url": reverse("rentals:customer_list"),
-        },
-    )
+    return render(request, "rentals/import_csv.html", _CUSTOMER_IMPORT_CONTEXT)
+
+
+def _iter_rental_import_rows(upload):
+    """Yield the picked cells of each rental import row, or None for rows missing a key field."""
+    rows = _read_csv_values(upload)
+    header = next(rows, None)
+    if header is None:
+        return
+    # Resolve every alias group to column positions once; a repeated header keeps
+    # its last column, as the dict-based reader did.
+    columns = {name: position for position, name in enumerate(header)}
+    (
+        plate_columns,
+        license_columns,
+        start_date_columns,
+        end_date_columns,
+        daily_rate_columns,
+        total_price_columns,
+        contract_number_columns,
+        status_columns,
+    ) = [tuple(columns[key] for key in keys if key in columns) for keys in _RENTAL_KEY_GROUPS]
+    for row in rows:
+        plate = _pick_position(row, plate_columns)
+        license_number = _pick_position(row, license_columns)
+        start_date = _parse_date(_pick_position(row, start_date_columns))
+        end_date = _parse_date(_pick_position(row, end_date_columns))
+        plate = (plate or "").strip()
+        license_number = (license_number or "").strip()
+
+        if not all([plate, license_number, start_date, end_date]):
+            yield None
+            continue
+        # Keep only the picked cells, not the whole row, until the chunk is written.
+        yield (
+            plate,
+            license_number,
+            start_date,
+            end_date,
+            _pick_position(row, daily_rate_columns),
+            _pick_position(row, total_price_columns),
+            _pick_position(row, contract_number_columns),
+            _pick_position(row, status_columns),
+        )
+
+
+def _import_rental_chunk(parsed_rows, pricing_cache: dict) -> tuple[int, int, int]:
+    """Upsert one chunk of _iter_rental_import_rows output; return (imported, missing, skipped)."""
+    imported, missing_relations, skipped = 0, 0, 0
+    cars = Car.objects.in_bulk({item[0] for item in parsed_rows}, field_name="plate_number")
+    customers = {}
+    # license_number is not unique; keep the oldest customer for each license.
+    for customer in Customer.objects.filter(
+        license_number__in={item[1] for item in parsed_rows}
+    ).order_by("pk"):
+        customers.setdefault(customer.license_number, customer)
+
+    # Rows are merged per (car, customer, start, end) the way sequential
+    # update_or_create calls would merge them, then written in bulk.
+    pending: dict[tuple, dict] = {}
+    for (
+        plate,
+        license_number,
+        start_date,
+        end_date,
+        daily_rate_raw,
+        total_price_value,
+        contract_number,
+        status_value,
+    ) in parsed_rows:
+        car = cars.get(plate)
+        customer = customers.get(license_number)
+        if car is None or customer is None:
+            missing_relations += 1
+            continue
+
+        pricing_key = (car.pk, start_date, end_date)
+        breakdown = pricing_cache.get(pricing_key)
+        if breakdown is None:
+            # Each call reads BusinessSettings, so reuse results for repeated periods.
+            breakdown = pricing_cache[pricing_key] = calculate_rental_pricing(car, start_date, end_date)
+        if breakdown.days <= 0:
+            skipped += 1
+            continue
+
+        daily_rate = (
+            _parse_decimal(daily_rate_raw) if daily_rate_raw not in (None, "") else breakdown.daily_rate
+        )
+
+        total_price = (
+            _parse_decimal(total_price_value)
+            if total_price_value not in (None, "")
+            else daily_rate * Decimal(breakdown.days)
+        )
+
+        contract_number = (contract_number or "").strip()
+        values = {
+            "daily_rate": daily_rate,
+            "total_price": total_price,
+            "status": _clean_status(status_value),
+        }
+        if contract_number:
+            values["contract_number"] = contract_number
+        pending.setdefault((car.pk, customer.pk, start_date, end_date), {}).update(values)
+        imported += 1
+
+    existing_rentals: dict[tuple, Rental] = {}
+    if pending:
+        for rental in Rental.objects.filter(
+            car_id__in={key[0] for key in pending},
+            customer_id__in={key[1] for key in pending},
+            start_date__in={key[2] for key in pending},
+        ).order_by("pk"):
+            existing_rentals.setdefault(
+                (rental.car_id, rental.customer_id, rental.start_date, rental.end_date), rental
+            )
+
+    # A contract number is kept only if no other rental (saved or imported) uses it.
+    requested_numbers = {values["contract_number"] for values in pending.values() if "contract_number" in values}
+    used_numbers: dict[str, set[tuple]] = {}
+    for number, *key in Rental.objects.filter(contract_number__in=requested_numbers).values_list(
+        "contract_number", "car_id", "customer_id", "start_date", "end_date"
+    ):
+        used_numbers.setdefault(number, set()).add(tuple(key))
+    claimed: dict[str, tuple] = {}
+    for key, values in pending.items():
+        contract_number = values.get("contract_number")
+        if not contract_number:
+            continue
+        conflict = claimed.get(contract_number, key) != key or bool(
+            used_numbers.get(contract_number, set()) - {key}
+        )
+        if conflict:
+            del values["contract_number"]
+        else:
+            claimed[contract_number] = key
+
+    to_create: list[Rental] = []
+    to_update: list[Rental] = []
+    for key, values in pending.items():
+        rental = existing_rentals.get(key)
+        if rental is None:
+            car_id, customer_id, start_date, end_date = key
+            to_create.append(
+                Rental(car_id=car_id, customer_id=customer_id, start_date=start_date, end_date=end_date, **values)
+            )
+        else:
+            for field, value in values.items():
+                setattr(rental, field, value)
+            to_update.append(rental)
+
+    # bulk_create skips Rental.save, so hand out contract numbers here.
+    unnumbered = [rental for rental in chain(to_create, to_update) if not rental.contract_number]
+    if unnumbered:
+        numbers = Rental.generate_unique_contract_numbers(len(unnumbered), exclude=claimed)
+        for rental, number in zip(unnumbered, numbers):
+            rental.contract_number = number
+
+    if to_create:
+        Rental.objects.bulk_create(to_create, batch_size=IMPORT_BATCH_SIZE)
+    if to_update:
+        Rental.objects.bulk_update(to_update, RENTAL_IMPORT_UPDATE_FIELDS, batch_size=IMPORT_BATCH_SIZE)
+    return imported, missing_relations, skipped
 
 
 @login_required
@@ -2080,90 +2683,22 @@ def import_rentals_csv(request):
         if not upload:
             messages.error(request, "Пожалуйста, выберите файл с разделителями.")
         else:
-            decoded = upload.read().decode("utf-8-sig").splitlines()
-            reader = csv.DictReader(decoded)
             imported, missing_relations, skipped = 0, 0, 0
-
-            for row in reader:
-                plate = _pick_value(
-                    row,
-                    [
-                        "car_plate_number",
-                        "plate_number",
-                        "Госномер",
-                        "Гос. номер",
-                        "Регистрационный знак",
-                    ],
-                )
-                license_number = _pick_value(
-                    row,
-                    [
-                        "customer_license_number",
-                        "license_number",
-                        "Номер ВУ",
-                        "Водительское удостоверение",
-                    ],
-                )
-                start_date = _parse_date(_pick_value(row, ["start_date", "Дата начала"]))
-                end_date = _parse_date(_pick_value(row, ["end_date", "Дата окончания"]))
-                plate = (plate or "").strip()
-                license_number = (license_number or "").strip()
-
-                if not all([plate, license_number, start_date, end_date]):
-                    skipped += 1
-                    continue
-
-                try:
-                    car = Car.objects.get(plate_number=plate)
-                except Car.DoesNotExist:
-                    missing_relations += 1
-                    continue
-
-                try:
-                    customer = Customer.objects.get(license_number=license_number)
-                except Customer.DoesNotExist:
-                    missing_relations += 1
-                    continue
-
-                breakdown = calculate_rental_pricing(car, start_date, end_date)
-                if breakdown.days <= 0:
-                    skipped += 1
-                    continue
-
-                daily_rate_raw = _pick_value(row, ["daily_rate", "Суточный тариф", "Базовый тариф"])
-                daily_rate = (
-                    _parse_decimal(daily_rate_raw) if daily_rate_raw not in (None, "") else breakdown.daily_rate
-                )
-
-                total_price_value = _pick_value(row, ["total_price", "Итоговая сумма"])
-                total_price = (
-                    _parse_decimal(total_price_value)
-                    if total_price_value not in (None, "")
-                    else daily_rate * Decimal(breakdown.days)
-                )
-
-                contract_number = (_pick_value(row, ["contract_number", "Номер договора"]) or "").strip()
-                status_value = _pick_value(row, ["status", "Статус"])
-                if contract_number:
-                    exists_conflict = Rental.objects.exclude(
-                        car=car, customer=customer, start_date=start_date, end_date=end_date
-                    ).filter(contract_number=contract_number)
-                    if exists_conflict.exists():
-                        contract_number = ""
-
-                Rental.objects.update_or_create(
-                    car=car,
-                    customer=customer,
-                    start_date=start_date,
-                    end_date=end_date,
-                    defaults={
-                        "daily_rate": daily_rate,
-                        "total_price": total_price,
-                        "status": _clean_status(status_value),
-                        **({"contract_number": contract_number} if contract_number else {}),
-                    },
-                )
-                imported += 1
+            pricing_cache: dict[tuple, object] = {}
+            rows = _iter_rental_import_rows(upload)
+            with _import_transaction():
+                # Each chunk is written before the next one is read, so a rental repeated
+                # across chunks updates the row saved by the earlier chunk.
+                while chunk := list(islice(rows, IMPORT_BATCH_SIZE)):
+                    parsed_rows = [item for item in chunk if item is not None]
+                    skipped += len(chunk) - len(parsed_rows)
+                    chunk_imported, chunk_missing, chunk_skipped = _import_rental_chunk(parsed_rows, pricing_cache)
+                    imported += chunk_imported
+                    missing_relations += chunk_missing
+                    skipped += chunk_skipped
+            if imported:
+                # bulk_create skips post_save, so drop the cached dashboard explicitly.
+                invalidate_dashboard()
 
             if imported:
                 messages.success(request, f"Импортировано аренд: {imported}.")
@@ -2177,26 +2712,7 @@ def import_rentals_csv(request):
 
             return redirect("rentals:rental_list")
 
-    return render(
-        request,
-        "rentals/import_csv.html",
-        {
-            "title": "Импорт аренд",
-            "expected_headers": [
-                "Номер договора",
-                "Госномер",
-                "Номер ВУ",
-                "Клиент",
-                "Дата начала",
-                "Дата окончания",
-                "Суточный тариф",
-                "Итоговая сумма",
-                "Статус",
-            ],
-            "help_text": "Перед импортом аренды должны быть заведены автомобили и клиенты. Номер договора можно не указывать.",
-            "back_url": reverse("rentals:rental_list"),
-        },
-    )
+    return render(request, "rentals/import_csv.html", _RENTAL_IMPORT_CONTEXT)
 
 
 @login_required
@@ -2225,13 +2741,14 @@ def generate_contract(request, rental_id, template_id):
                 extra={"template_id": ct.id, "rental_id": rental.id},
             )
             return HttpResponse("Не удалось сформировать документ Ворд.", status=500)
-        response = HttpResponse(
-            file_io.getvalue(),
+        # FileResponse streams the buffer instead of copying it into a bytes body.
+        file_io.seek(0)
+        return FileResponse(
+            file_io,
+            as_attachment=True,
+            filename=f"договор_{rental.id}.docx",
             content_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
         )
-        filename = f"договор_{rental.id}.docx"
-        response["Content-Disposition"] = f"attachment; filename*=UTF-8''{quote(filename)}"
-        return response
 
     elif ct.format == "pdf":
         try:
@@ -2243,10 +2760,10 @@ def generate_contract(request, rental_id, template_id):
             )
             return HttpResponse("Не удалось сформировать ПДФ-договор.", status=500)
 
-        response = HttpResponse(file_io.getvalue(), content_type="application/pdf")
-        filename = f"договор_{rental.id}.pdf"
-        response["Content-Disposition"] = f"attachment; filename*=UTF-8''{quote(filename)}"
-        return response
+        file_io.seek(0)
+        return FileResponse(
+            file_io, as_attachment=True, filename=f"договор_{rental.id}.pdf", content_type="application/pdf"
+        )
 
     else:
         return HttpResponse("Неизвестный формат шаблона", status=400)